@@ -0,0 +1,81 @@
+"""tune hnsw index parameters by table cardinality
+
+Revision ID: 0b8e5d3f6a17
+Revises: f7a4c9d21e05
+Create Date: 2026-10-16 10:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0b8e5d3f6a17'
+down_revision: Union[str, None] = 'f7a4c9d21e05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of the tiers this revision builds with: (upper bound on
+# vector count, index build parameters + query-time ef_search)
+_HNSW_TIERS = [
+    (100_000, {'m': 16, 'ef_construction': 64, 'ef_search': 40}),
+    (1_000_000, {'m': 24, 'ef_construction': 100, 'ef_search': 100}),
+    (float('inf'), {'m': 32, 'ef_construction': 128, 'ef_search': 200}),
+]
+_EF_SEARCH_SETTING = 'hnsw_ef_search'
+
+_HNSW_INDEXES = [
+    ('ix_meetings_embedding_hnsw', 'meetings'),
+    ('ix_transcript_chunks_embedding_hnsw', 'transcript_chunks'),
+    ('ix_profiles_embedding_hnsw', 'profiles'),
+]
+
+
+def _estimated_rows(table: str) -> int:
+    """Planner row estimate; -1 (never analyzed) is treated as empty."""
+    reltuples = op.get_bind().execute(
+        sa.text("SELECT reltuples FROM pg_class WHERE relname = :t"), {"t": table}
+    ).scalar()
+    return max(int(reltuples or 0), 0)
+
+
+def _hnsw_params(vector_count: int) -> dict[str, int]:
+    for upper_bound, params in _HNSW_TIERS:
+        if vector_count < upper_bound:
+            return params
+    return _HNSW_TIERS[-1][1]
+
+
+def _rebuild(index_name: str, table: str, m: int, ef_construction: int) -> None:
+    op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    op.execute(
+        f"CREATE INDEX {index_name} ON {table} "
+        f"USING hnsw (embedding vector_cosine_ops) "
+        f"WITH (m = {m}, ef_construction = {ef_construction})"
+    )
+
+
+def upgrade() -> None:
+    ef_search = 0
+    for index_name, table in _HNSW_INDEXES:
+        params = _hnsw_params(_estimated_rows(table))
+        _rebuild(index_name, table, params['m'], params['ef_construction'])
+        ef_search = max(ef_search, params['ef_search'])
+
+    op.get_bind().execute(
+        sa.text(
+            "INSERT INTO app_settings (key, value, is_secret, created_at, updated_at) "
+            "VALUES (:key, :value, false, now(), now()) "
+            "ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = now()"
+        ),
+        {"key": _EF_SEARCH_SETTING, "value": str(ef_search)},
+    )
+
+
+def downgrade() -> None:
+    op.get_bind().execute(
+        sa.text("DELETE FROM app_settings WHERE key = :key"),
+        {"key": _EF_SEARCH_SETTING},
+    )
+    for index_name, table in _HNSW_INDEXES:
+        _rebuild(index_name, table, 24, 128)
@@ -0,0 +1,59 @@
+"""quantize embedding columns to halfvec
+
+Revision ID: 1c9f6e4a7b28
+Revises: 0b8e5d3f6a17
+Create Date: 2026-10-16 11:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '1c9f6e4a7b28'
+down_revision: Union[str, None] = '0b8e5d3f6a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_HNSW_INDEXES = [
+    ('ix_meetings_embedding_hnsw', 'meetings'),
+    ('ix_transcript_chunks_embedding_hnsw', 'transcript_chunks'),
+    ('ix_profiles_embedding_hnsw', 'profiles'),
+]
+
+
+def _index_options(index_name: str) -> str:
+    """Build parameters of an existing index, e.g. ``m=16, ef_construction=64``.
+
+    The type change has to drop and recreate each index; reusing its own
+    reloptions keeps whatever 0b8e5d3f6a17 chose for the table.
+    """
+    options = op.get_bind().execute(
+        sa.text(
+            "SELECT array_to_string(reloptions, ', ') FROM pg_class WHERE relname = :i"
+        ),
+        {"i": index_name},
+    ).scalar()
+    return options or 'm = 16, ef_construction = 64'
+
+
+def _convert(column_type: str, opclass: str) -> None:
+    for index_name, table in _HNSW_INDEXES:
+        options = _index_options(index_name)
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN embedding "
+            f"TYPE {column_type} USING embedding::{column_type}"
+        )
+        op.execute(
+            f"CREATE INDEX {index_name} ON {table} "
+            f"USING hnsw (embedding {opclass}) WITH ({options})"
+        )
+
+
+def upgrade() -> None:
+    _convert('halfvec(1536)', 'halfvec_cosine_ops')
+
+
+def downgrade() -> None:
+    _convert('vector(1536)', 'vector_cosine_ops')
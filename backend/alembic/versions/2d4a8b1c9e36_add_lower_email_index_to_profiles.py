@@ -0,0 +1,30 @@
+"""add lower(email) index to profiles
+
+Revision ID: 2d4a8b1c9e36
+Revises: 1c9f6e4a7b28
+Create Date: 2026-10-16 12:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '2d4a8b1c9e36'
+down_revision: Union[str, None] = '1c9f6e4a7b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Non-unique: existing case-variant duplicates are left for the profile
+    # merge flow rather than rewritten here
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_profiles_email_lower "
+            "ON profiles (lower(email)) WHERE email IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_profiles_email_lower")
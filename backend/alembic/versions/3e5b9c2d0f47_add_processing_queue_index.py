@@ -0,0 +1,31 @@
+"""add partial covering queue index to meeting_processing_status
+
+Revision ID: 3e5b9c2d0f47
+Revises: 2d4a8b1c9e36
+Create Date: 2026-10-16 12:30:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '3e5b9c2d0f47'
+down_revision: Union[str, None] = '2d4a8b1c9e36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_mps_queue',
+        'meeting_processing_status',
+        ['agent_name', 'status'],
+        unique=False,
+        postgresql_include=['meeting_id', 'retry_count'],
+        postgresql_where=sa.text("status IN ('pending', 'failed')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_mps_queue', table_name='meeting_processing_status')
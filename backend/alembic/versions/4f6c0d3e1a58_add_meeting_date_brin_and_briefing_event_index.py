@@ -0,0 +1,32 @@
+"""add brin index on meetings.date and briefings.calendar_event_id index
+
+Revision ID: 4f6c0d3e1a58
+Revises: 3e5b9c2d0f47
+Create Date: 2026-10-16 13:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '4f6c0d3e1a58'
+down_revision: Union[str, None] = '3e5b9c2d0f47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_meetings_date_brin',
+        'meetings',
+        ['date'],
+        unique=False,
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+    op.create_index('ix_briefings_calendar_event_id', 'briefings', ['calendar_event_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_briefings_calendar_event_id', table_name='briefings')
+    op.drop_index('ix_meetings_date_brin', table_name='meetings', postgresql_using='brin')
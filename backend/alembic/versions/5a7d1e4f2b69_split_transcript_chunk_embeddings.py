@@ -0,0 +1,66 @@
+"""move transcript chunk embeddings to a narrow side table
+
+Revision ID: 5a7d1e4f2b69
+Revises: 4f6c0d3e1a58
+Create Date: 2026-10-16 13:30:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import HALFVEC
+
+
+revision: str = '5a7d1e4f2b69'
+down_revision: Union[str, None] = '4f6c0d3e1a58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _index_options(index_name: str) -> str:
+    """Build parameters of an existing index, e.g. ``m=16, ef_construction=64``."""
+    options = op.get_bind().execute(
+        sa.text(
+            "SELECT array_to_string(reloptions, ', ') FROM pg_class WHERE relname = :i"
+        ),
+        {"i": index_name},
+    ).scalar()
+    return options or 'm = 16, ef_construction = 64'
+
+
+def upgrade() -> None:
+    op.create_table('transcript_chunk_embeddings',
+    sa.Column('chunk_id', sa.Uuid(), nullable=False),
+    sa.Column('embedding', HALFVEC(1536), nullable=False),
+    sa.ForeignKeyConstraint(['chunk_id'], ['transcript_chunks.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('chunk_id')
+    )
+    op.execute("""
+        INSERT INTO transcript_chunk_embeddings (chunk_id, embedding)
+        SELECT id, embedding FROM transcript_chunks WHERE embedding IS NOT NULL
+    """)
+    # The side table holds the same vectors, so it keeps the old index's
+    # build parameters
+    options = _index_options('ix_transcript_chunks_embedding_hnsw')
+    op.execute("DROP INDEX IF EXISTS ix_transcript_chunks_embedding_hnsw")
+    op.drop_column('transcript_chunks', 'embedding')
+
+    op.execute(
+        "CREATE INDEX ix_transcript_chunk_embeddings_hnsw ON transcript_chunk_embeddings "
+        f"USING hnsw (embedding halfvec_cosine_ops) WITH ({options})"
+    )
+
+
+def downgrade() -> None:
+    options = _index_options('ix_transcript_chunk_embeddings_hnsw')
+    op.add_column('transcript_chunks', sa.Column('embedding', HALFVEC(1536), nullable=True))
+    op.execute("""
+        UPDATE transcript_chunks tc SET embedding = tce.embedding
+        FROM transcript_chunk_embeddings tce
+        WHERE tce.chunk_id = tc.id
+    """)
+    op.drop_table('transcript_chunk_embeddings')
+    op.execute(
+        "CREATE INDEX ix_transcript_chunks_embedding_hnsw ON transcript_chunks "
+        f"USING hnsw (embedding halfvec_cosine_ops) WITH ({options})"
+    )
@@ -0,0 +1,59 @@
+"""generate search_vector columns server-side
+
+Revision ID: 6b8e2f5a3c70
+Revises: 5a7d1e4f2b69
+Create Date: 2026-10-16 13:45:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+MEETING_SEARCH_VECTOR_SQL = (
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(raw_notes, '') || ' ' "
+    "|| coalesce(enhanced_notes, '') || ' ' || coalesce(summary, ''))"
+)
+CHUNK_SEARCH_VECTOR_SQL = (
+    "to_tsvector('english', coalesce(speaker, '') || ' ' || coalesce(content, ''))"
+)
+
+
+revision: str = '6b8e2f5a3c70'
+down_revision: Union[str, None] = '5a7d1e4f2b69'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Postgres cannot turn an existing column into a generated one, so drop and
+    # re-add; the STORED expression backfills every row on ADD COLUMN.
+    op.drop_index('ix_meetings_search_vector', table_name='meetings', postgresql_using='gin')
+    op.drop_column('meetings', 'search_vector')
+    op.add_column('meetings', sa.Column(
+        'search_vector', postgresql.TSVECTOR(),
+        sa.Computed(MEETING_SEARCH_VECTOR_SQL, persisted=True), nullable=True,
+    ))
+    op.create_index('ix_meetings_search_vector', 'meetings', ['search_vector'], unique=False, postgresql_using='gin')
+
+    op.drop_index('ix_transcript_chunks_search_vector', table_name='transcript_chunks', postgresql_using='gin')
+    op.drop_column('transcript_chunks', 'search_vector')
+    op.add_column('transcript_chunks', sa.Column(
+        'search_vector', postgresql.TSVECTOR(),
+        sa.Computed(CHUNK_SEARCH_VECTOR_SQL, persisted=True), nullable=True,
+    ))
+    op.create_index('ix_transcript_chunks_search_vector', 'transcript_chunks', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transcript_chunks_search_vector', table_name='transcript_chunks', postgresql_using='gin')
+    op.drop_column('transcript_chunks', 'search_vector')
+    op.add_column('transcript_chunks', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute(f"UPDATE transcript_chunks SET search_vector = {CHUNK_SEARCH_VECTOR_SQL}")
+    op.create_index('ix_transcript_chunks_search_vector', 'transcript_chunks', ['search_vector'], unique=False, postgresql_using='gin')
+
+    op.drop_index('ix_meetings_search_vector', table_name='meetings', postgresql_using='gin')
+    op.drop_column('meetings', 'search_vector')
+    op.add_column('meetings', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute(f"UPDATE meetings SET search_vector = {MEETING_SEARCH_VECTOR_SQL}")
+    op.create_index('ix_meetings_search_vector', 'meetings', ['search_vector'], unique=False, postgresql_using='gin')
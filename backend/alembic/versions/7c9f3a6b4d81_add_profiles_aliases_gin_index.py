@@ -0,0 +1,26 @@
+"""add jsonb_path_ops GIN index on profiles.aliases
+
+Revision ID: 7c9f3a6b4d81
+Revises: 6b8e2f5a3c70
+Create Date: 2026-10-16 14:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '7c9f3a6b4d81'
+down_revision: Union[str, None] = '6b8e2f5a3c70'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_profiles_aliases_gin', 'profiles', ['aliases'], unique=False,
+        postgresql_using='gin', postgresql_ops={'aliases': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_profiles_aliases_gin', table_name='profiles', postgresql_using='gin')
@@ -0,0 +1,43 @@
+"""store mcp_connections.oauth_tokens as bytea
+
+Revision ID: 8d0a4b7c5e92
+Revises: 7c9f3a6b4d81
+Create Date: 2026-10-16 14:15:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '8d0a4b7c5e92'
+down_revision: Union[str, None] = '7c9f3a6b4d81'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fernet tokens are urlsafe base64; decode them to the underlying bytes
+    op.alter_column(
+        'mcp_connections', 'oauth_tokens',
+        type_=sa.LargeBinary(),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        postgresql_using="decode(translate(oauth_tokens, '-_', '+/'), 'base64')",
+    )
+
+
+def downgrade() -> None:
+    # 0x02-prefixed rows are ChaCha20-Poly1305 blobs, whose text form is
+    # "v2:" + standard base64; anything else is a raw Fernet token
+    op.alter_column(
+        'mcp_connections', 'oauth_tokens',
+        type_=sa.Text(),
+        existing_type=sa.LargeBinary(),
+        existing_nullable=True,
+        postgresql_using=(
+            "CASE WHEN substring(oauth_tokens from 1 for 1) = '\\x02'::bytea "
+            "THEN 'v2:' || replace(encode(substring(oauth_tokens from 2), 'base64'), E'\\n', '') "
+            "ELSE translate(replace(encode(oauth_tokens, 'base64'), E'\\n', ''), '+/', '-_') END"
+        ),
+    )
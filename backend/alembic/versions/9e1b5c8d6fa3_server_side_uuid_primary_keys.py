@@ -0,0 +1,44 @@
+"""generate uuid primary keys server-side
+
+Revision ID: 9e1b5c8d6fa3
+Revises: 8d0a4b7c5e92
+Create Date: 2026-10-16 14:30:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '9e1b5c8d6fa3'
+down_revision: Union[str, None] = '8d0a4b7c5e92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    'action_items',
+    'agent_run_log',
+    'attendees',
+    'briefings',
+    'mcp_connections',
+    'meeting_processing_status',
+    'meetings',
+    'profiles',
+    'transcript_chunks',
+)
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from PG 13; pgcrypto covers older servers
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table in TABLES:
+        op.alter_column(
+            table, 'id',
+            existing_type=sa.Uuid(),
+            server_default=sa.text('gen_random_uuid()'),
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', existing_type=sa.Uuid(), server_default=None)
@@ -0,0 +1,78 @@
+"""right-size agent_run_log counters and status enums
+
+Revision ID: a0c2d6e9f1b4
+Revises: 9e1b5c8d6fa3
+Create Date: 2026-10-16 14:45:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'a0c2d6e9f1b4'
+down_revision: Union[str, None] = '9e1b5c8d6fa3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+agent_run_status = postgresql.ENUM('running', 'completed', 'failed', name='agent_run_status')
+processing_status = postgresql.ENUM('pending', 'processing', 'completed', 'failed', name='processing_status')
+
+
+def _drop_queue_index() -> None:
+    op.drop_index('ix_mps_queue', table_name='meeting_processing_status')
+
+
+def _create_queue_index() -> None:
+    op.create_index(
+        'ix_mps_queue', 'meeting_processing_status', ['agent_name', 'status'],
+        unique=False,
+        postgresql_include=['meeting_id', 'retry_count'],
+        postgresql_where=sa.text("status IN ('pending', 'failed')"),
+    )
+
+
+def _retype_status(table: str, type_name: str, default: str) -> None:
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN status DROP DEFAULT")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN status TYPE {type_name} USING status::{type_name}")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN status SET DEFAULT '{default}'")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    agent_run_status.create(bind)
+    processing_status.create(bind)
+
+    op.drop_constraint('ck_agent_run_log_status', 'agent_run_log', type_='check')
+    _retype_status('agent_run_log', 'agent_run_status', 'running')
+    op.alter_column('agent_run_log', 'tokens_used', type_=sa.BigInteger(), existing_type=sa.Integer(), existing_nullable=False)
+    op.alter_column('agent_run_log', 'duration_ms', type_=sa.BigInteger(), existing_type=sa.Integer(), existing_nullable=True)
+
+    # The partial index predicate compares status to text, so rebuild it around the retype
+    _drop_queue_index()
+    op.drop_constraint('ck_processing_status', 'meeting_processing_status', type_='check')
+    _retype_status('meeting_processing_status', 'processing_status', 'pending')
+    _create_queue_index()
+
+
+def downgrade() -> None:
+    _drop_queue_index()
+    _retype_status('meeting_processing_status', 'varchar', 'pending')
+    op.create_check_constraint(
+        'ck_processing_status', 'meeting_processing_status',
+        "status IN ('pending', 'processing', 'completed', 'failed')",
+    )
+    _create_queue_index()
+
+    op.alter_column('agent_run_log', 'duration_ms', type_=sa.Integer(), existing_type=sa.BigInteger(), existing_nullable=True)
+    op.alter_column('agent_run_log', 'tokens_used', type_=sa.Integer(), existing_type=sa.BigInteger(), existing_nullable=False)
+    _retype_status('agent_run_log', 'varchar', 'running')
+    op.create_check_constraint(
+        'ck_agent_run_log_status', 'agent_run_log',
+        "status IN ('running', 'completed', 'failed')",
+    )
+
+    bind = op.get_bind()
+    processing_status.drop(bind)
+    agent_run_status.drop(bind)
@@ -0,0 +1,26 @@
+"""add pg_trgm index on lower(profiles.name)
+
+Revision ID: b1d3e7f0a2c5
+Revises: a0c2d6e9f1b4
+Create Date: 2026-10-16 15:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'b1d3e7f0a2c5'
+down_revision: Union[str, None] = 'a0c2d6e9f1b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_profiles_name_trgm ON profiles USING gin (lower(name) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_profiles_name_trgm', table_name='profiles', postgresql_using='gin')
@@ -0,0 +1,33 @@
+"""unique (meeting_id, chunk_index) on transcript_chunks
+
+Revision ID: c2e4f8a1b3d6
+Revises: b1d3e7f0a2c5
+Create Date: 2026-10-16 15:15:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'c2e4f8a1b3d6'
+down_revision: Union[str, None] = 'b1d3e7f0a2c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep one row per (meeting_id, chunk_index) before enforcing uniqueness
+    op.execute("""
+        DELETE FROM transcript_chunks tc
+        USING transcript_chunks dup
+        WHERE tc.meeting_id = dup.meeting_id
+          AND tc.chunk_index = dup.chunk_index
+          AND tc.ctid > dup.ctid
+    """)
+    op.create_unique_constraint(
+        'uq_transcript_chunks_meeting_chunk', 'transcript_chunks', ['meeting_id', 'chunk_index']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_transcript_chunks_meeting_chunk', 'transcript_chunks', type_='unique')
@@ -0,0 +1,23 @@
+"""add (date, id) btree index on meetings for keyset pagination
+
+Revision ID: d3f5a9b2c4e7
+Revises: c2e4f8a1b3d6
+Create Date: 2026-10-16 15:30:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'd3f5a9b2c4e7'
+down_revision: Union[str, None] = 'c2e4f8a1b3d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_meetings_date_id', 'meetings', ['date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_meetings_date_id', table_name='meetings')
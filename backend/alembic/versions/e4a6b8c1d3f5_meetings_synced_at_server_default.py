@@ -0,0 +1,24 @@
+"""default meetings.synced_at to now() on the server
+
+Revision ID: e4a6b8c1d3f5
+Revises: d3f5a9b2c4e7
+Create Date: 2026-10-16 16:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e4a6b8c1d3f5'
+down_revision: Union[str, None] = 'd3f5a9b2c4e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column('meetings', 'synced_at', server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    op.alter_column('meetings', 'synced_at', server_default=None)
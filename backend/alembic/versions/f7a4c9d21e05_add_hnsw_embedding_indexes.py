@@ -0,0 +1,39 @@
+"""add hnsw indexes on embedding columns
+
+Revision ID: f7a4c9d21e05
+Revises: e6f3a2b70d14
+Create Date: 2026-10-16 09:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'f7a4c9d21e05'
+down_revision: Union[str, None] = 'e6f3a2b70d14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_HNSW_INDEXES = [
+    ('ix_meetings_embedding_hnsw', 'meetings'),
+    ('ix_transcript_chunks_embedding_hnsw', 'transcript_chunks'),
+    ('ix_profiles_embedding_hnsw', 'profiles'),
+]
+
+
+def upgrade() -> None:
+    for index_name, table in _HNSW_INDEXES:
+        op.create_index(
+            index_name,
+            table,
+            ['embedding'],
+            unique=False,
+            postgresql_using='hnsw',
+            postgresql_with={'m': 24, 'ef_construction': 128},
+            postgresql_ops={'embedding': 'vector_cosine_ops'},
+        )
+
+
+def downgrade() -> None:
+    for index_name, table in reversed(_HNSW_INDEXES):
+        op.drop_index(index_name, table_name=table, postgresql_using='hnsw')
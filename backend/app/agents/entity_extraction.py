@@ -8,6 +8,7 @@ Requires an OpenAI API key. If unavailable, the agent skips gracefully.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import uuid
@@ -15,11 +16,12 @@ from datetime import datetime
 from typing import Any
 
 from openai import AsyncOpenAI
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.agents.base import AgentState, BaseAgent
+from app.agents.profile_builder import merge_profile_traits
 from app.config import settings
 from app.models.action_item import ActionItem
 from app.models.meeting import Meeting
@@ -27,6 +29,8 @@ from app.models.profile import Profile
 
 logger = logging.getLogger(__name__)
 
+EXTRACTION_BATCH_SIZE = 10
+
 EXTRACTION_SYSTEM_PROMPT = """You are an entity extraction and summarization system. Given meeting notes and transcript, extract structured entities and generate a concise summary.
 
 Return a JSON object with exactly these keys:
@@ -66,6 +70,8 @@ async def extract_entities_for_meetings(
     """Standalone entity extraction that works outside LangGraph."""
     from app.db.neo4j_driver import get_neo4j_driver
     from app.db.postgres import async_session_factory
+    from app.services.embedding_service import EmbeddingService
+    from app.services.entity_resolution_service import EntityResolutionService
     from app.services.neo4j_service import Neo4jService
 
     if not settings.openai_api_key or settings.openai_api_key == "sk-your-key-here":
@@ -74,6 +80,7 @@ async def extract_entities_for_meetings(
     driver = await get_neo4j_driver()
     neo4j_svc = Neo4jService(driver)
     client = AsyncOpenAI(api_key=settings.openai_api_key)
+    embedding_service = EmbeddingService()
 
     processed = 0
     entities_count = 0
@@ -144,65 +151,79 @@ async def extract_entities_for_meetings(
                     date=meeting.date.isoformat() if meeting.date else "",
                 )
 
+                meeting_key = str(meeting.id)
+                people: list[dict[str, Any]] = []
+                orgs: list[dict[str, Any]] = []
+                topics: list[dict[str, Any]] = []
+                mentioned: list[dict[str, Any]] = []
+                works_at: list[dict[str, Any]] = []
+                orgs_mentioned: list[dict[str, Any]] = []
+                discussed: list[dict[str, Any]] = []
+
+                named_people = [p for p in extraction.get("people", []) if p.get("name")]
+                resolver = EntityResolutionService(session, embedding_service)
+                resolved_people = await resolver.resolve_many(
+                    [{"name": p["name"], "email": p.get("email"), "entity_type": "contact"}
+                     for p in named_people],
+                    meeting_key,
+                )
+                for person, entity in zip(named_people, resolved_people):
+                    await _enrich_profile_traits(
+                        session, uuid.UUID(entity["entity_id"]),
+                        role=person.get("role"),
+                        organization=person.get("organization"),
+                    )
+
                 for person in extraction.get("people", []):
                     person_id = (person.get("email") or
                                  person.get("name", "").lower().replace(" ", "_"))
                     if person_id:
-                        await neo4j_svc.create_entity("Person", person_id, {
+                        people.append({"id": person_id, "props": {
                             "name": person.get("name"),
                             "email": person.get("email"),
-                        })
-                        await neo4j_svc.create_relationship(
-                            "Person", person_id,
-                            "Meeting", str(meeting.id),
-                            "MENTIONED_IN", {"count": 1},
-                        )
+                        }})
+                        mentioned.append({"from_id": person_id, "to_id": meeting_key, "props": {"count": 1}})
                         if person.get("organization"):
                             org_id = person["organization"].lower().replace(" ", "_")
-                            await neo4j_svc.create_entity("Organization", org_id, {
-                                "name": person["organization"],
+                            orgs.append({"id": org_id, "props": {"name": person["organization"]}})
+                            works_at.append({
+                                "from_id": person_id, "to_id": org_id,
+                                "props": {"role": person.get("role")},
                             })
-                            await neo4j_svc.create_relationship(
-                                "Person", person_id,
-                                "Organization", org_id,
-                                "WORKS_AT", {"role": person.get("role")},
-                            )
-
-                        await _enrich_profile_traits(
-                            session, person.get("name"),
-                            role=person.get("role"),
-                            organization=person.get("organization"),
-                        )
                     entities_count += 1
 
                 for org in extraction.get("organizations", []):
                     org_id = org.get("name", "").lower().replace(" ", "_")
                     if org_id:
-                        await neo4j_svc.create_entity("Organization", org_id, {
+                        orgs.append({"id": org_id, "props": {
                             "name": org["name"],
                             "domain": org.get("domain"),
-                        })
-                        await neo4j_svc.create_relationship(
-                            "Organization", org_id,
-                            "Meeting", str(meeting.id),
-                            "MENTIONED_IN", {"count": 1},
-                        )
+                        }})
+                        orgs_mentioned.append({"from_id": org_id, "to_id": meeting_key, "props": {"count": 1}})
                     entities_count += 1
 
                 for topic in extraction.get("topics", []):
                     topic_id = topic.get("name", "").lower().replace(" ", "_")
                     if topic_id:
-                        await neo4j_svc.create_entity("Topic", topic_id, {
+                        topics.append({"id": topic_id, "props": {
                             "name": topic["name"],
                             "category": topic.get("category"),
+                        }})
+                        discussed.append({
+                            "from_id": meeting_key, "to_id": topic_id,
+                            "props": {"relevance_score": 1.0},
                         })
-                        await neo4j_svc.create_relationship(
-                            "Meeting", str(meeting.id),
-                            "Topic", topic_id,
-                            "DISCUSSED", {"relevance_score": 1.0},
-                        )
                     entities_count += 1
 
+                # Nodes first so the relationship MATCHes find both endpoints
+                await neo4j_svc.create_entities_batch("Person", people)
+                await neo4j_svc.create_entities_batch("Organization", orgs)
+                await neo4j_svc.create_entities_batch("Topic", topics)
+                await neo4j_svc.create_relationships_batch("Person", "Meeting", "MENTIONED_IN", mentioned)
+                await neo4j_svc.create_relationships_batch("Person", "Organization", "WORKS_AT", works_at)
+                await neo4j_svc.create_relationships_batch("Organization", "Meeting", "MENTIONED_IN", orgs_mentioned)
+                await neo4j_svc.create_relationships_batch("Meeting", "Topic", "DISCUSSED", discussed)
+
                 for ai_data in extraction.get("action_items", []):
                     action_item = ActionItem(
                         meeting_id=meeting.id,
@@ -234,41 +255,82 @@ async def extract_entities_for_meetings(
     }
 
 
+async def extract_entities_from_queue(
+    meeting_queue: asyncio.Queue[str | None],
+    batch_size: int = EXTRACTION_BATCH_SIZE,
+    limit: int = 50,
+) -> dict[str, Any]:
+    """Extract entities for meeting ids as they arrive on *meeting_queue*.
+
+    Ids are processed in batches of *batch_size* until a None sentinel.
+    If the queue carried no ids, falls back to the most recent meetings,
+    as extract_entities_for_meetings does without meeting_ids.
+    """
+    totals: dict[str, Any] = {"processed": 0, "entities": 0, "action_items": 0, "errors": []}
+
+    async def _extract(meeting_ids: list[str] | None) -> None:
+        # Never raise: the producer blocks on a full queue if we stop reading
+        try:
+            result = await extract_entities_for_meetings(meeting_ids=meeting_ids, limit=limit)
+        except Exception as e:
+            logger.warning("Entity extraction batch failed: %s", e)
+            totals["errors"].append({"meeting_ids": meeting_ids, "error": str(e)})
+            return
+        for key in ("processed", "entities", "action_items"):
+            totals[key] += result.get(key, 0)
+        totals["errors"].extend(result.get("errors", []))
+        if "skipped_reason" in result:
+            totals["skipped_reason"] = result["skipped_reason"]
+
+    batch: list[str] = []
+    received = False
+    while (meeting_id := await meeting_queue.get()) is not None:
+        received = True
+        batch.append(meeting_id)
+        if len(batch) >= batch_size:
+            await _extract(batch)
+            batch = []
+    if batch:
+        await _extract(batch)
+    if not received:
+        await _extract(None)
+
+    return totals
+
+
 async def _enrich_profile_traits(
     session: AsyncSession,
-    name: str | None,
+    profile_id: uuid.UUID,
     role: str | None = None,
     organization: str | None = None,
 ) -> None:
-    """Push observed role/organization into the matching Profile's traits."""
-    if not name:
-        return
-
-    stmt = select(Profile).where(func.lower(Profile.name) == name.lower())
-    result = await session.execute(stmt)
-    profile = result.scalar_one_or_none()
-    if not profile:
+    """Push observed role/organization into the resolved Profile's traits."""
+    if not role and not organization:
         return
 
-    traits = profile.traits or {}
-    changed = False
+    # Read the column rather than the ORM object: merge_profile_traits skips
+    # the identity map, so a cached Profile would be stale after an earlier
+    # mention of the same person and the || merge would drop its additions
+    result = await session.execute(select(Profile.traits).where(Profile.id == profile_id))
+    traits = result.scalar_one_or_none() or {}
+    patch: dict[str, Any] = {}
 
     if role:
         observed_roles = set(traits.get("observed_roles", []))
         if role not in observed_roles:
             observed_roles.add(role)
-            traits["observed_roles"] = sorted(observed_roles)
-            changed = True
+            patch["observed_roles"] = sorted(observed_roles)
 
     if organization:
         observed_orgs = set(traits.get("organizations", []))
         if organization not in observed_orgs:
             observed_orgs.add(organization)
-            traits["organizations"] = sorted(observed_orgs)
-            changed = True
+            patch["organizations"] = sorted(observed_orgs)
 
-    if changed:
-        profile.traits = traits
+    if patch:
+        # profile_builder updates other trait keys concurrently; merge on the
+        # server instead of writing back the whole document read above
+        await merge_profile_traits(session, profile_id, patch)
 
 
 def _build_extraction_text(meeting: Meeting) -> str:
@@ -12,7 +12,9 @@ bypasses LangGraph to avoid greenlet/async-session incompatibilities.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
@@ -152,8 +154,16 @@ def normalize_meeting(detail: dict[str, Any], granola_id: str) -> dict[str, Any]
     }
 
 
-async def sync_all_meetings(granola_provider: Any) -> dict[str, Any]:
-    """Standalone sync that runs outside LangGraph to avoid greenlet issues."""
+async def sync_all_meetings(
+    granola_provider: Any,
+    meeting_queue: asyncio.Queue[str | None] | None = None,
+) -> dict[str, Any]:
+    """Standalone sync that runs outside LangGraph to avoid greenlet issues.
+
+    If meeting_queue is given, each new meeting id is put on it as soon as
+    the meeting is committed, so a downstream consumer can start early.
+    The caller owns the queue and sends the end-of-stream sentinel.
+    """
     from app.db.postgres import async_session_factory
     from app.services.meeting_service import MeetingService
 
@@ -167,12 +177,13 @@ async def sync_all_meetings(granola_provider: Any) -> dict[str, Any]:
     except Exception as e:
         return {"new": 0, "updated": 0, "skipped": 0, "errors": [str(e)]}
 
-    if not isinstance(meetings_list, list):
+    # The MCP provider yields normalized meetings lazily; the cache returns a list
+    if not isinstance(meetings_list, (list, Iterator)):
         meetings_list = []
 
-    logger.info("Granola returned %d meetings to sync", len(meetings_list))
-
+    seen = 0
     for meeting_data in meetings_list:
+        seen += 1
         granola_id = meeting_data.get("id")
         if not granola_id:
             continue
@@ -213,14 +224,16 @@ async def sync_all_meetings(granola_provider: Any) -> dict[str, Any]:
                     updated_ids.append(meeting_id)
                 else:
                     new_ids.append(meeting_id)
+                    if meeting_queue is not None:
+                        await meeting_queue.put(meeting_id)
 
         except Exception as e:
             logger.warning("Failed to sync meeting %s: %s", granola_id, e)
             errors.append({"granola_id": granola_id, "error": str(e)})
 
     logger.info(
-        "Sync complete: %d new, %d updated, %d skipped, %d errors",
-        len(new_ids), len(updated_ids), len(skipped_ids), len(errors),
+        "Sync complete: %d from Granola, %d new, %d updated, %d skipped, %d errors",
+        seen, len(new_ids), len(updated_ids), len(skipped_ids), len(errors),
     )
 
     if new_ids or updated_ids:
@@ -14,7 +14,8 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, type_coerce, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agents.base import AgentState, BaseAgent
@@ -37,9 +38,37 @@ Do NOT invent facts not supported by the data. If information is sparse, keep th
 Return ONLY the bio paragraph text, no JSON, no markdown."""
 
 
+async def merge_profile_traits(
+    session: AsyncSession, profile_id: uuid.UUID, patch: dict[str, Any]
+) -> None:
+    """Merge *patch* into a profile's traits server-side (``traits || patch``).
+
+    Sync-pipeline agents run concurrently and each own different trait
+    keys; writing back a whole traits document read earlier would drop
+    whatever another agent committed in between.
+    """
+    await session.execute(
+        update(Profile)
+        .where(Profile.id == profile_id)
+        .values(
+            traits=func.coalesce(Profile.traits, type_coerce({}, JSONB)).op("||")(
+                type_coerce(patch, JSONB)
+            )
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
 async def ensure_attendee_profiles() -> dict[str, Any]:
-    """Fast pass: guarantee every meeting attendee has a profile. No LLM calls."""
+    """Fast pass: guarantee every meeting attendee has a profile. No LLM calls.
+
+    Attendees with an email are resolved in one batch, so a new address for
+    a known person links to their profile. Names that miss the exact stage
+    are embedded in a single request.
+    """
     from app.db.postgres import async_session_factory
+    from app.services.embedding_service import EmbeddingService
+    from app.services.entity_resolution_service import EntityResolutionService
 
     created = 0
     updated = 0
@@ -55,6 +84,7 @@ async def ensure_attendee_profiles() -> dict[str, Any]:
                 func.min(Meeting.date).label("first_seen"),
             )
             .join(Meeting, Attendee.meeting_id == Meeting.id)
+            .where(Attendee.email.isnot(None), Attendee.email != "")
             .group_by(Attendee.name, Attendee.email)
         )
         result = await session.execute(attendees_stmt)
@@ -62,46 +92,27 @@ async def ensure_attendee_profiles() -> dict[str, Any]:
 
         logger.info("Found %d unique attendees across meetings", len(attendee_rows))
 
-        for row in attendee_rows:
-            name = row.name
-            email = row.email
-            meeting_count = row.meeting_count
-            last_seen = row.last_seen
-            first_seen = row.first_seen
+        resolver = EntityResolutionService(session, EmbeddingService())
+        entities = await resolver.resolve_many(
+            [{"name": row.name, "email": row.email, "entity_type": "contact"} for row in attendee_rows],
+            meeting_id="",
+        )
 
+        for row, entity in zip(attendee_rows, entities):
             try:
-                profile = None
-                if email:
-                    stmt = select(Profile).where(func.lower(Profile.email) == email.lower())
-                    res = await session.execute(stmt)
-                    profile = res.scalar_one_or_none()
-
-                if profile:
-                    traits = profile.traits or {}
-                    traits["meeting_count"] = meeting_count
-                    traits["last_seen"] = last_seen.isoformat() if last_seen else None
-                    traits["first_seen"] = first_seen.isoformat() if first_seen else None
-                    profile.traits = traits
-                    updated += 1
-                elif email:
-                    profile = Profile(
-                        id=uuid.uuid4(),
-                        type="contact",
-                        name=name,
-                        email=email,
-                        bio=None,
-                        traits={
-                            "meeting_count": meeting_count,
-                            "last_seen": last_seen.isoformat() if last_seen else None,
-                            "first_seen": first_seen.isoformat() if first_seen else None,
-                        },
-                    )
-                    session.add(profile)
+                await merge_profile_traits(session, uuid.UUID(entity["entity_id"]), {
+                    "meeting_count": row.meeting_count,
+                    "last_seen": row.last_seen.isoformat() if row.last_seen else None,
+                    "first_seen": row.first_seen.isoformat() if row.first_seen else None,
+                })
+                if entity["is_new"]:
                     created += 1
+                else:
+                    updated += 1
 
             except Exception as e:
-                logger.warning("Profile build failed for %s: %s", name, e)
-                errors.append({"name": name, "error": str(e)})
+                logger.warning("Profile build failed for %s: %s", row.name, e)
+                errors.append({"name": row.name, "error": str(e)})
 
         self_stmt = select(Profile).where(Profile.type == "self")
         res = await session.execute(self_stmt)
@@ -56,38 +56,43 @@ async def build_relationships_from_meetings() -> dict[str, Any]:
                 att_result = await session.execute(att_stmt)
                 attendees = att_result.all()
 
-                person_ids: list[tuple[str, str]] = []
-                for att_name, att_email in attendees:
-                    person_id = att_email or att_name.lower().replace(" ", "_")
-                    await neo4j_svc.create_entity("Person", person_id, {
-                        "name": att_name,
-                        "email": att_email,
-                    })
-                    await neo4j_svc.create_relationship(
-                        "Person", person_id,
-                        "Meeting", str(meeting_id),
-                        "ATTENDED",
-                        {"role": "attendee"},
-                    )
-                    person_ids.append((person_id, att_name))
-                    new_rels += 1
-
-                for (p1_id, p1_name), (p2_id, p2_name) in combinations(person_ids, 2):
-                    if p1_id == p2_id:
-                        continue
-                    result_rel = await neo4j_svc.strengthen_relationship(
-                        "Person", p1_id,
-                        "Person", p2_id,
-                        "KNOWS",
-                        context=f"Co-attended: {title}",
-                        last_seen=str(meeting_id),
-                    )
-                    if result_rel:
-                        strength = result_rel.get("strength", 1)
-                        if strength > 1:
-                            strengthened += 1
-                        else:
-                            new_rels += 1
+                person_ids = [
+                    att_email or att_name.lower().replace(" ", "_")
+                    for att_name, att_email in attendees
+                ]
+
+                # One UNWIND write per step instead of a round-trip per attendee/pair
+                await neo4j_svc.create_entities_batch("Person", [
+                    {"id": person_id, "props": {"name": att_name, "email": att_email}}
+                    for person_id, (att_name, att_email) in zip(person_ids, attendees)
+                ])
+                await neo4j_svc.create_relationships_batch(
+                    "Person", "Meeting", "ATTENDED",
+                    [
+                        {"from_id": person_id, "to_id": str(meeting_id), "props": {"role": "attendee"}}
+                        for person_id in person_ids
+                    ],
+                )
+                new_rels += len(person_ids)
+
+                strengths = await neo4j_svc.strengthen_relationships_batch(
+                    "Person", "Person", "KNOWS",
+                    [
+                        {
+                            "from_id": p1_id,
+                            "to_id": p2_id,
+                            "context": f"Co-attended: {title}",
+                            "last_seen": str(meeting_id),
+                        }
+                        for p1_id, p2_id in combinations(person_ids, 2)
+                        if p1_id != p2_id
+                    ],
+                )
+                for strength in strengths:
+                    if strength > 1:
+                        strengthened += 1
+                    else:
+                        new_rels += 1
 
                 meetings_processed += 1
 
@@ -15,10 +15,17 @@ router = APIRouter()
 async def list_meetings(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    count: bool = Query(False, description="Exact total instead of the planner estimate"),
     session: AsyncSession = Depends(get_db_session),
 ):
     service = MeetingService(session)
-    return await service.list_meetings(page=page, page_size=page_size)
+    try:
+        return await service.list_meetings(
+            page=page, page_size=page_size, cursor=cursor, exact_count=count
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
 
 @router.get("/{meeting_id}")
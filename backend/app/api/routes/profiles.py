@@ -9,6 +9,7 @@ from app.db.postgres import get_db_session
 from app.models.action_item import ActionItem
 from app.models.meeting import Attendee, Meeting
 from app.models.profile import Profile
+from app.services.entity_resolution_service import forget_resolutions
 
 router = APIRouter()
 
@@ -123,6 +124,7 @@ async def update_own_profile(
         profile.notes = body.notes
 
     await session.flush()
+    forget_resolutions(str(profile.id))
     return await _profile_detail(session, profile)
 
 
@@ -169,6 +171,7 @@ async def update_profile(
         profile.notes = body.notes
 
     await session.flush()
+    forget_resolutions(str(profile.id))
     return await _profile_detail(session, profile)
 
 
@@ -313,6 +316,7 @@ async def merge_profiles(
 
     await session.delete(other)
     await session.flush()
+    forget_resolutions(str(other.id))
 
     return await _profile_detail(session, primary)
 
@@ -19,12 +19,13 @@ class SearchRequest(BaseModel):
 @router.post("/")
 async def search(
     body: SearchRequest,
+    request: Request,
     session: AsyncSession = Depends(get_db_session),
 ):
     from app.db.neo4j_driver import _driver
 
     embedding_service = get_embedding_service()
-    service = SearchService(session, _driver, embedding_service)
+    service = SearchService(session, _driver, embedding_service, request.app.state.redis)
 
     results = await service.hybrid_search(
         query=body.query,
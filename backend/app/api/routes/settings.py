@@ -10,7 +10,8 @@ from datetime import datetime
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings as app_settings
@@ -176,17 +177,25 @@ def _apply_setting_to_runtime(key: str, value: str) -> None:
         app_settings.primary_user_email = value
     elif key == "primary_user_name":
         app_settings.primary_user_name = value
+    elif key == "hnsw_ef_search":
+        try:
+            app_settings.hnsw_ef_search = int(value)
+        except ValueError:
+            pass
 
 
 async def load_settings_from_db() -> None:
     """Called on startup to load DB settings into the runtime config.
 
-    DB values take priority over .env values.
+    DB values take priority over .env values. The runtime config then acts as
+    the settings cache: reads are attribute lookups, and every write path
+    goes through _apply_setting_to_runtime so it never goes stale.
     If primary_user_email is still empty, fall back to the self-profile.
     """
-    from app.db.postgres import async_session_factory
+    from app.db.postgres import async_session_factory, engine
     from app.models.profile import Profile
 
+    ef_search_before = app_settings.hnsw_ef_search
     try:
         async with async_session_factory() as session:
             stmt = select(AppSetting).where(AppSetting.value != "")
@@ -210,17 +219,19 @@ async def load_settings_from_db() -> None:
                     email = self_profile.email.lower()
                     name = self_profile.name if self_profile.name != "Me" else ""
 
-                    for key, value in [("primary_user_email", email), ("primary_user_name", name)]:
-                        if not value:
-                            continue
-                        existing = await session.execute(
-                            select(AppSetting).where(AppSetting.key == key)
-                        )
-                        row = existing.scalar_one_or_none()
-                        if row:
-                            row.value = value
-                        else:
-                            session.add(AppSetting(key=key, value=value, is_secret=False))
+                    pairs = {
+                        key: value
+                        for key, value in [("primary_user_email", email), ("primary_user_name", name)]
+                        if value
+                    }
+                    upsert = pg_insert(AppSetting).values(
+                        [{"key": k, "value": v, "is_secret": False} for k, v in pairs.items()]
+                    )
+                    await session.execute(upsert.on_conflict_do_update(
+                        index_elements=["key"],
+                        set_={"value": upsert.excluded.value, "updated_at": func.now()},
+                    ))
+                    for key, value in pairs.items():
                         _apply_setting_to_runtime(key, value)
 
                     await session.commit()
@@ -228,5 +239,10 @@ async def load_settings_from_db() -> None:
                     logging.getLogger(__name__).info(
                         "Populated primary user from self-profile: %s (%s)", email, name
                     )
+
+        # ef_search is applied when a pooled connection is opened, so recycle
+        # the connections opened before the tuned value was known
+        if app_settings.hnsw_ef_search != ef_search_before:
+            await engine.dispose()
     except Exception:
         pass
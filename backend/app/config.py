@@ -7,6 +7,8 @@ class Settings(BaseSettings):
     neo4j_user: str = "neo4j"
     neo4j_password: str = "password"
     redis_url: str = "redis://localhost:6379/0"
+    redis_pool_size: int = 20
+    hnsw_ef_search: int = 100
 
     openai_api_key: str = ""
     openai_model: str = "gpt-4o"
@@ -1,13 +1,68 @@
 from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
+from pgvector import HalfVector
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.config import settings
 
-engine = create_async_engine(settings.database_url, echo=False, pool_size=10, max_overflow=20)
+
+def _json_dumps(value: Any) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    pool_size=10,
+    max_overflow=20,
+    insertmanyvalues_page_size=1000,
+    # JSONB columns (profile traits, learning logs, briefing context) are
+    # encoded per row; orjson does that in C instead of the stdlib encoder
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+)
 async_session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+def _encode_halfvec(value: Any) -> bytes:
+    # pgvector's HALFVEC column type renders ORM binds as text before they
+    # reach the driver; raw query params arrive as HalfVector or lists
+    if isinstance(value, str):
+        value = HalfVector.from_text(value)
+    elif not isinstance(value, HalfVector):
+        value = HalfVector(value)
+    return value.to_binary()
+
+
+async def _register_halfvec_codec(conn) -> None:
+    await conn.set_type_codec(
+        "halfvec",
+        schema="public",
+        encoder=_encode_halfvec,
+        decoder=HalfVector.from_binary,
+        format="binary",
+    )
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _configure_connection(dbapi_connection, connection_record) -> None:
+    """Apply per-connection planner settings for pgvector HNSW scans.
+
+    Also switches halfvec to asyncpg's binary protocol, so 1536-d vectors
+    travel as ~3 KB of float16 instead of ~25 KB of decimal text.
+    """
+    # Run on the raw asyncpg connection, outside any transaction: the
+    # adapter cursor would open one, and a later rollback would revert a
+    # plain SET for the rest of the pooled connection's life
+    dbapi_connection.run_async(
+        lambda conn: conn.execute(f"SET hnsw.ef_search = {int(settings.hnsw_ef_search)}")
+    )
+    dbapi_connection.run_async(_register_halfvec_codec)
+
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
         try:
@@ -31,7 +31,14 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
 
-    app.state.redis = aioredis.from_url(settings.redis_url, decode_responses=True)
+    # One bounded pool shared by every Redis user in the process; callers
+    # wait for a free connection rather than failing when it is exhausted
+    app.state.redis_pool = aioredis.BlockingConnectionPool.from_url(
+        settings.redis_url,
+        max_connections=settings.redis_pool_size,
+        decode_responses=True,
+    )
+    app.state.redis = aioredis.Redis(connection_pool=app.state.redis_pool)
 
     mcp_registry = MCPRegistry()
     mcp_registry.auto_discover()
@@ -94,7 +101,8 @@ async def lifespan(app: FastAPI):
     yield
 
     await scheduler.stop()
-    await app.state.redis.close()
+    await app.state.redis.aclose()
+    await app.state.redis_pool.disconnect()
     await close_neo4j_driver()
 
 
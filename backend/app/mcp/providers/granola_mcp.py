@@ -14,6 +14,7 @@ import logging
 import secrets
 import time
 from base64 import urlsafe_b64encode
+from collections.abc import Iterator
 from typing import Any
 from urllib.parse import urlencode
 
@@ -39,6 +40,8 @@ class GranolaMCPProvider(BaseMCPProvider):
         self._access_token: str | None = None
         self._refresh_token_value: str | None = None
         self._token_expires_at: float = 0
+        # Monotonic deadline until which the access token needs no refresh check
+        self._fresh_until_monotonic: float = 0
         self._connected = False
         self._request_counter = 0
 
@@ -66,6 +69,7 @@ class GranolaMCPProvider(BaseMCPProvider):
         self._refresh_token_value = credentials.get("refresh_token")
         self._token_expires_at = credentials.get("expires_at", 0)
         self._client_id = credentials.get("client_id", self._client_id)
+        self._mark_token_fresh()
 
         try:
             await self._discover_oauth()
@@ -116,6 +120,7 @@ class GranolaMCPProvider(BaseMCPProvider):
         self._access_token = None
         self._refresh_token_value = None
         self._token_expires_at = 0
+        self._fresh_until_monotonic = 0
         self._connected = False
         return True
 
@@ -253,6 +258,7 @@ class GranolaMCPProvider(BaseMCPProvider):
         self._access_token = new_tokens["access_token"]
         self._refresh_token_value = new_tokens["refresh_token"]
         self._token_expires_at = new_tokens["expires_at"]
+        self._mark_token_fresh()
         return new_tokens
 
     # ── MCP tool interface ────────────────────────────────────────
@@ -322,9 +328,28 @@ class GranolaMCPProvider(BaseMCPProvider):
 
     @staticmethod
     def _parse_sse_response(body: str) -> Any:
-        """Extract the last JSON-RPC result from a Server-Sent Events stream."""
+        """Extract the last JSON-RPC result from a Server-Sent Events stream.
+
+        Only the final ``data:`` frame is decoded on the common path; the full
+        line-by-line scan is kept as a fallback for streams whose tail frame
+        is not a result (e.g. a trailing notification or malformed frame).
+        """
         import json
 
+        prefix = "\ndata: "
+        start = ("\n" + body).rfind(prefix)
+        if start != -1:
+            # Offsets are relative to the "\n"-prefixed body, hence -1 + len(prefix)
+            data_start = start - 1 + len(prefix)
+            end = body.find("\n", data_start)
+            frame = body[data_start:end if end != -1 else len(body)].rstrip("\r")
+            try:
+                parsed = json.loads(frame)
+                if isinstance(parsed, dict) and "result" in parsed:
+                    return parsed["result"]
+            except json.JSONDecodeError:
+                pass
+
         last_data: Any = None
         for line in body.splitlines():
             if line.startswith("data: "):
@@ -340,7 +365,17 @@ class GranolaMCPProvider(BaseMCPProvider):
             raise RuntimeError("No valid JSON-RPC result in SSE stream")
         return last_data
 
+    def _mark_token_fresh(self) -> None:
+        """Cache how long the current token stays fresh on the monotonic clock."""
+        if not self._token_expires_at:
+            self._fresh_until_monotonic = float("inf")
+            return
+        remaining = max(0.0, (self._token_expires_at - time.time()) - 60)
+        self._fresh_until_monotonic = time.monotonic() + remaining
+
     async def _ensure_token_fresh(self) -> None:
+        if time.monotonic() < self._fresh_until_monotonic:
+            return
         if self._token_expires_at and time.time() > self._token_expires_at - 60:
             if self._refresh_token_value:
                 refreshed = await self.refresh_token(self._refresh_token_value)
@@ -543,10 +578,9 @@ class GranolaMCPProvider(BaseMCPProvider):
             if isinstance(data, dict):
                 meetings = data.get("meetings", data.get("data", data.get("items", [])))
             if isinstance(meetings, list):
-                normalized = [self._normalize_mcp_meeting(m) for m in meetings if isinstance(m, dict)]
-                logger.debug("Normalized %d meetings from MCP (raw had %d items)",
-                             len(normalized), len(meetings))
-                return normalized
+                # Lazily normalized so the sync loop never holds a second full copy
+                logger.debug("Normalizing %d meetings from MCP", len(meetings))
+                return self._iter_normalized_meetings(meetings)
         if internal_name == "get-document":
             if isinstance(data, list) and len(data) > 0:
                 return self._normalize_mcp_meeting(data[0], include_notes=True)
@@ -563,6 +597,18 @@ class GranolaMCPProvider(BaseMCPProvider):
             return self._extract_people_from_meetings(data)
         return data
 
+    def _iter_normalized_meetings(self, meetings: list[Any]) -> Iterator[dict[str, Any]]:
+        # Runs inside the caller's sync loop, past execute_tool's error
+        # handling, so a malformed record is skipped here rather than
+        # aborting the whole sync
+        for m in meetings:
+            if not isinstance(m, dict):
+                continue
+            try:
+                yield self._normalize_mcp_meeting(m)
+            except Exception as e:
+                logger.warning("Skipping malformed MCP meeting %s: %s", m.get("id"), e)
+
     @staticmethod
     def _normalize_mcp_meeting(m: dict[str, Any], include_notes: bool = False) -> dict[str, Any]:
         attendees = []
@@ -2,13 +2,14 @@ from app.models.action_item import ActionItem
 from app.models.agent_run_log import AgentRunLog
 from app.models.briefing import Briefing
 from app.models.connection import MCPConnection
-from app.models.meeting import Attendee, Meeting, TranscriptChunk
+from app.models.meeting import Attendee, Meeting, TranscriptChunk, TranscriptChunkEmbedding
 from app.models.processing_status import MeetingProcessingStatus
 from app.models.profile import Profile
 
 __all__ = [
     "Meeting",
     "TranscriptChunk",
+    "TranscriptChunkEmbedding",
     "Attendee",
     "ActionItem",
     "Briefing",
@@ -1,21 +1,25 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, Integer, String, Text
+from sqlalchemy import BigInteger, Enum, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base, TimestampMixin
 
+AgentRunStatus = Enum("running", "completed", "failed", name="agent_run_status")
+
 
 class AgentRunLog(TimestampMixin, Base):
     __tablename__ = "agent_run_log"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, server_default=func.gen_random_uuid()
+    )
     pipeline: Mapped[str] = mapped_column(String, nullable=False)
     agent_name: Mapped[str] = mapped_column(String, nullable=False)
     trigger: Mapped[str] = mapped_column(String, nullable=False)
     status: Mapped[str] = mapped_column(
-        String, nullable=False, server_default="running"
+        AgentRunStatus, nullable=False, server_default="running"
     )
     meetings_processed: Mapped[int] = mapped_column(
         Integer, nullable=False, server_default="0"
@@ -27,16 +31,9 @@ class AgentRunLog(TimestampMixin, Base):
         Integer, nullable=False, server_default="0"
     )
     tokens_used: Mapped[int] = mapped_column(
-        Integer, nullable=False, server_default="0"
+        BigInteger, nullable=False, server_default="0"
     )
-    duration_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    duration_ms: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     result_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     started_at: Mapped[datetime] = mapped_column(nullable=False)
     completed_at: Mapped[datetime | None] = mapped_column(nullable=True)
-
-    __table_args__ = (
-        CheckConstraint(
-            "status IN ('running', 'completed', 'failed')",
-            name="ck_agent_run_log_status",
-        ),
-    )
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -10,7 +10,9 @@ from app.models.base import Base, TimestampMixin
 class Briefing(TimestampMixin, Base):
     __tablename__ = "briefings"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, server_default=func.gen_random_uuid()
+    )
     meeting_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("meetings.id"), nullable=True
     )
@@ -20,3 +22,7 @@ class Briefing(TimestampMixin, Base):
     topics: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     attendee_context: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     action_items_context: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+
+    __table_args__ = (
+        Index("ix_briefings_calendar_event_id", "calendar_event_id"),
+    )
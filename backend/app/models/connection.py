@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, Text
+from sqlalchemy import LargeBinary, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -11,12 +11,14 @@ from app.models.base import Base, TimestampMixin
 class MCPConnection(TimestampMixin, Base):
     __tablename__ = "mcp_connections"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, server_default=func.gen_random_uuid()
+    )
     provider: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     status: Mapped[str] = mapped_column(
         String, nullable=False, server_default="disconnected"
     )
-    oauth_tokens: Mapped[str | None] = mapped_column(Text, nullable=True)
+    oauth_tokens: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
     config: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     last_sync: Mapped[datetime | None] = mapped_column(nullable=True)
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
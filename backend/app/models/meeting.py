@@ -3,18 +3,29 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import Float, ForeignKey, Index, Integer, String, Text
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import Computed, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
 
+# search_vector columns are generated by Postgres so they never go stale
+MEETING_SEARCH_VECTOR_SQL = (
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(raw_notes, '') || ' ' "
+    "|| coalesce(enhanced_notes, '') || ' ' || coalesce(summary, ''))"
+)
+CHUNK_SEARCH_VECTOR_SQL = (
+    "to_tsvector('english', coalesce(speaker, '') || ' ' || coalesce(content, ''))"
+)
+
 
 class Meeting(TimestampMixin, Base):
     __tablename__ = "meetings"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, server_default=func.gen_random_uuid()
+    )
     granola_id: Mapped[str | None] = mapped_column(String, unique=True, nullable=True)
     title: Mapped[str] = mapped_column(String, nullable=False)
     date: Mapped[datetime] = mapped_column(nullable=False)
@@ -23,9 +34,13 @@ class Meeting(TimestampMixin, Base):
     enhanced_notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     next_call_brief: Mapped[str | None] = mapped_column(Text, nullable=True)
-    search_vector: Mapped[None] = mapped_column(TSVECTOR, nullable=True)
-    embedding = mapped_column(Vector(1536), nullable=True)
-    synced_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    search_vector: Mapped[None] = mapped_column(
+        TSVECTOR,
+        Computed(MEETING_SEARCH_VECTOR_SQL, persisted=True),
+        nullable=True,
+    )
+    embedding = mapped_column(HALFVEC(1536), nullable=True)
+    synced_at: Mapped[datetime | None] = mapped_column(nullable=True, server_default=func.now())
     sync_source: Mapped[str | None] = mapped_column(String(16), nullable=True)
 
     transcript_chunks: Mapped[list[TranscriptChunk]] = relationship(
@@ -40,13 +55,31 @@ class Meeting(TimestampMixin, Base):
 
     __table_args__ = (
         Index("ix_meetings_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_meetings_date_brin",
+            "date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # Ordered keyset pagination on (date, id); BRIN can't return rows in order
+        Index("ix_meetings_date_id", "date", "id"),
+        Index(
+            "ix_meetings_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            # m/ef_construction are picked by table size when migrations
+            # build the index (0b8e5d3f6a17), so none are declared here
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
     )
 
 
 class TranscriptChunk(TimestampMixin, Base):
     __tablename__ = "transcript_chunks"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, server_default=func.gen_random_uuid()
+    )
     meeting_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False
     )
@@ -55,12 +88,18 @@ class TranscriptChunk(TimestampMixin, Base):
     content: Mapped[str] = mapped_column(Text, nullable=False)
     start_time: Mapped[float | None] = mapped_column(Float, nullable=True)
     end_time: Mapped[float | None] = mapped_column(Float, nullable=True)
-    search_vector: Mapped[None] = mapped_column(TSVECTOR, nullable=True)
-    embedding = mapped_column(Vector(1536), nullable=True)
+    search_vector: Mapped[None] = mapped_column(
+        TSVECTOR,
+        Computed(CHUNK_SEARCH_VECTOR_SQL, persisted=True),
+        nullable=True,
+    )
 
     meeting: Mapped[Meeting] = relationship(back_populates="transcript_chunks")
 
     __table_args__ = (
+        UniqueConstraint(
+            "meeting_id", "chunk_index", name="uq_transcript_chunks_meeting_chunk"
+        ),
         Index(
             "ix_transcript_chunks_search_vector",
             "search_vector",
@@ -69,10 +108,38 @@ class TranscriptChunk(TimestampMixin, Base):
     )
 
 
+class TranscriptChunkEmbedding(Base):
+    """Chunk embeddings kept in a narrow side table.
+
+    ANN scans and HNSW builds only touch (chunk_id, embedding) instead of
+    walking the wide transcript_chunks rows with their text and tsvector.
+    """
+
+    __tablename__ = "transcript_chunk_embeddings"
+
+    chunk_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("transcript_chunks.id", ondelete="CASCADE"), primary_key=True
+    )
+    embedding = mapped_column(HALFVEC(1536), nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_transcript_chunk_embeddings_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            # m/ef_construction are picked by table size when migrations
+            # build the index (0b8e5d3f6a17), so none are declared here
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+    )
+
+
 class Attendee(TimestampMixin, Base):
     __tablename__ = "attendees"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, server_default=func.gen_random_uuid()
+    )
     meeting_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False
     )
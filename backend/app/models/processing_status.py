@@ -1,22 +1,28 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Enum, ForeignKey, Index, Integer, String, Text, UniqueConstraint, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base, TimestampMixin
 
+ProcessingStatus = Enum(
+    "pending", "processing", "completed", "failed", name="processing_status"
+)
+
 
 class MeetingProcessingStatus(TimestampMixin, Base):
     __tablename__ = "meeting_processing_status"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, server_default=func.gen_random_uuid()
+    )
     meeting_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False
     )
     agent_name: Mapped[str] = mapped_column(String, nullable=False)
     status: Mapped[str] = mapped_column(
-        String, nullable=False, server_default="pending"
+        ProcessingStatus, nullable=False, server_default="pending"
     )
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     retry_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
@@ -25,8 +31,11 @@ class MeetingProcessingStatus(TimestampMixin, Base):
 
     __table_args__ = (
         UniqueConstraint("meeting_id", "agent_name", name="uq_processing_meeting_agent"),
-        CheckConstraint(
-            "status IN ('pending', 'processing', 'completed', 'failed')",
-            name="ck_processing_status",
+        Index(
+            "ix_mps_queue",
+            "agent_name",
+            "status",
+            postgresql_include=["meeting_id", "retry_count"],
+            postgresql_where=text("status IN ('pending', 'failed')"),
         ),
     )
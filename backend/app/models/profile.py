@@ -1,9 +1,9 @@
 import uuid
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import CheckConstraint, String, Text
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import CheckConstraint, Index, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, validates
 
 from app.models.base import Base, TimestampMixin
 
@@ -11,7 +11,9 @@ from app.models.base import Base, TimestampMixin
 class Profile(TimestampMixin, Base):
     __tablename__ = "profiles"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, server_default=func.gen_random_uuid()
+    )
     type: Mapped[str] = mapped_column(String, nullable=False)
     name: Mapped[str] = mapped_column(String, nullable=False)
     email: Mapped[str | None] = mapped_column(String, unique=True, nullable=True)
@@ -20,11 +22,44 @@ class Profile(TimestampMixin, Base):
     traits: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     aliases: Mapped[list | None] = mapped_column(JSONB, nullable=True)
     learning_log: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
-    embedding = mapped_column(Vector(1536), nullable=True)
+    embedding = mapped_column(HALFVEC(1536), nullable=True)
 
     __table_args__ = (
         CheckConstraint(
             "type IN ('self', 'contact', 'org')",
             name="ck_profiles_type",
         ),
+        Index(
+            "ix_profiles_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            # m/ef_construction are picked by table size when migrations
+            # build the index (0b8e5d3f6a17), so none are declared here
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+        Index(
+            "ix_profiles_aliases_gin",
+            "aliases",
+            postgresql_using="gin",
+            postgresql_ops={"aliases": "jsonb_path_ops"},
+        ),
     )
+
+    @validates("email")
+    def _normalize_email(self, key: str, value: str | None) -> str | None:
+        # Stored lowercase so the lower(email) index and exact lookups agree
+        return value.lower() if value else value
+
+
+Index(
+    "ix_profiles_email_lower",
+    func.lower(Profile.email),
+    postgresql_where=Profile.email.isnot(None),
+)
+
+Index(
+    "ix_profiles_name_trgm",
+    func.lower(Profile.name).label("name_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"name_lower": "gin_trgm_ops"},
+)
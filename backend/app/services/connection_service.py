@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.mcp.base import ProviderStatus
@@ -13,10 +15,16 @@ from app.mcp.registry import MCPRegistry
 from app.models.app_setting import AppSetting
 from app.models.connection import MCPConnection
 from app.models.profile import Profile
-from app.services.encryption_service import decrypt_tokens, encrypt_tokens
+from app.services.encryption_service import (
+    decrypt_tokens_from_bytes,
+    encrypt_tokens_to_bytes,
+)
 
 logger = logging.getLogger(__name__)
 
+RESTORE_CONCURRENCY = 8
+LAST_SYNC_ISO_FORMAT = 'YYYY-MM-DD"T"HH24:MI:SS.US'
+
 
 class ConnectionService:
     def __init__(self, session: AsyncSession, mcp_registry: MCPRegistry) -> None:
@@ -26,15 +34,25 @@ class ConnectionService:
     async def list_connections(self) -> list[dict[str, Any]]:
         """List all registered providers with their connection status."""
         providers = self.registry.list_all()
+        names = [p.name for p in providers]
+        # Only the display columns, with last_sync already formatted by Postgres
+        stmt = select(
+            MCPConnection.provider,
+            MCPConnection.status,
+            func.to_char(MCPConnection.last_sync, LAST_SYNC_ISO_FORMAT).label("last_sync"),
+            MCPConnection.last_error,
+        ).where(MCPConnection.provider.in_(names))
+        conns = {row.provider: row for row in await self.session.execute(stmt)}
+
         result = []
         for provider in providers:
-            conn = await self._get_connection_record(provider.name)
+            conn = conns.get(provider.name)
             result.append({
                 "provider": provider.name,
                 "description": provider.description,
                 "auth_type": provider.auth_type.value,
                 "status": conn.status if conn else "disconnected",
-                "last_sync": conn.last_sync.isoformat() if conn and conn.last_sync else None,
+                "last_sync": conn.last_sync if conn else None,
                 "last_error": conn.last_error if conn else None,
             })
         return result
@@ -61,14 +79,12 @@ class ConnectionService:
         conn = await self._get_or_create_connection(provider_name)
         if connected:
             conn.status = "connected"
-            conn.oauth_tokens = encrypt_tokens(tokens)
+            conn.oauth_tokens = encrypt_tokens_to_bytes(tokens)
             conn.last_error = None
         else:
             conn.status = "error"
             conn.last_error = "Connection failed after token exchange"
 
-        await self.session.flush()
-
         if connected and provider_name == "granola":
             user_email = tokens.get("user_email")
             user_name = tokens.get("user_name")
@@ -87,13 +103,12 @@ class ConnectionService:
         conn = await self._get_or_create_connection(provider_name)
         if connected:
             conn.status = "connected"
-            conn.oauth_tokens = encrypt_tokens(tokens)
+            conn.oauth_tokens = encrypt_tokens_to_bytes(tokens)
             conn.last_error = None
         else:
             conn.status = "error"
             conn.last_error = "Connection failed"
 
-        await self.session.flush()
         return connected
 
     async def disconnect(self, provider_name: str) -> bool:
@@ -106,7 +121,6 @@ class ConnectionService:
             conn.status = "disconnected"
             conn.oauth_tokens = None
             conn.last_error = None
-            await self.session.flush()
 
         return True
 
@@ -118,7 +132,6 @@ class ConnectionService:
         conn = await self._get_connection_record(provider_name)
         if conn:
             conn.status = "connected" if status == ProviderStatus.HEALTHY else status.value
-            await self.session.flush()
 
         return {"provider": provider_name, "status": status.value}
 
@@ -128,15 +141,27 @@ class ConnectionService:
 
         stmt = select(MCPConnection).where(MCPConnection.status == "connected")
         result = await self.session.execute(stmt)
-        connections = result.scalars().all()
+        connections = [c for c in result.scalars().all() if c.oauth_tokens]
 
-        for conn in connections:
-            if not conn.oauth_tokens:
-                continue
-            try:
-                tokens = decrypt_tokens(conn.oauth_tokens)
+        # Provider connects are independent network round-trips, so run them
+        # concurrently; session writes are applied afterwards, one at a time
+        sem = asyncio.Semaphore(RESTORE_CONCURRENCY)
+
+        async def _connect(conn: MCPConnection) -> tuple[dict[str, Any], Any, bool]:
+            async with sem:
+                tokens = decrypt_tokens_from_bytes(conn.oauth_tokens)
                 provider = self.registry.get(conn.provider)
-                connected = await provider.connect(tokens)
+                return tokens, provider, await provider.connect(tokens)
+
+        outcomes = await asyncio.gather(
+            *(_connect(c) for c in connections), return_exceptions=True
+        )
+
+        for conn, outcome in zip(connections, outcomes):
+            try:
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                tokens, provider, connected = outcome
                 if not connected:
                     conn.status = "error"
                     conn.last_error = "Failed to restore connection on startup"
@@ -149,7 +174,7 @@ class ConnectionService:
                             for key in ("user_email", "user_name"):
                                 if key in tokens:
                                     fresh_tokens[key] = tokens[key]
-                            conn.oauth_tokens = encrypt_tokens(fresh_tokens)
+                            conn.oauth_tokens = encrypt_tokens_to_bytes(fresh_tokens)
                             logger.info("Persisted refreshed tokens for %s", conn.provider)
 
                     if conn.provider == "granola" and not app_cfg.primary_user_email:
@@ -164,13 +189,10 @@ class ConnectionService:
                 conn.status = "error"
                 conn.last_error = "Restore failed"
 
-        await self.session.flush()
-
     async def update_last_sync(self, provider_name: str) -> None:
         conn = await self._get_connection_record(provider_name)
         if conn:
             conn.last_sync = datetime.now(timezone.utc)
-            await self.session.flush()
 
     async def _get_connection_record(self, provider_name: str) -> MCPConnection | None:
         stmt = select(MCPConnection).where(MCPConnection.provider == provider_name)
@@ -182,7 +204,6 @@ class ConnectionService:
         if conn is None:
             conn = MCPConnection(provider=provider_name, status="disconnected")
             self.session.add(conn)
-            await self.session.flush()
         return conn
 
     async def _persist_primary_user(self, email: str, name: str | None) -> None:
@@ -190,34 +211,37 @@ class ConnectionService:
         from app.config import settings as app_cfg
 
         email_lower = email.lower()
-
-        for key, value in [("primary_user_email", email_lower), ("primary_user_name", name or "")]:
-            if not value:
-                continue
-            stmt = select(AppSetting).where(AppSetting.key == key)
-            result = await self.session.execute(stmt)
-            row = result.scalar_one_or_none()
-            if row:
-                row.value = value
-            else:
-                self.session.add(AppSetting(key=key, value=value, is_secret=False))
+        pairs = {
+            key: value
+            for key, value in [("primary_user_email", email_lower), ("primary_user_name", name or "")]
+            if value
+        }
+
+        stmt = pg_insert(AppSetting).values(
+            [{"key": k, "value": v, "is_secret": False} for k, v in pairs.items()]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={"value": stmt.excluded.value, "updated_at": func.now()},
+        )
+        await self.session.execute(stmt)
+        for key, value in pairs.items():
             setattr(app_cfg, key, value)
 
         await self._ensure_self_profile(email_lower, name)
-        await self.session.flush()
         logger.info("Primary user set to %s (%s)", email_lower, name or "no name")
 
     async def _ensure_self_profile(self, email: str, name: str | None) -> None:
         """Guarantee exactly one Profile(type='self') with the given email."""
-        # Check if a profile with this email already exists
-        stmt = select(Profile).where(func.lower(Profile.email) == email)
-        result = await self.session.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        # Find any current self profile
-        stmt = select(Profile).where(Profile.type == "self")
-        result = await self.session.execute(stmt)
-        current_self = result.scalar_one_or_none()
+        # Fetch the profile owning this email and the current self profile together
+        stmt = select(Profile).where(
+            or_(func.lower(Profile.email) == email, Profile.type == "self")
+        )
+        candidates = (await self.session.execute(stmt)).scalars().all()
+        existing = next(
+            (p for p in candidates if p.email and p.email.lower() == email), None
+        )
+        current_self = next((p for p in candidates if p.type == "self"), None)
 
         if existing and existing.type == "self":
             if name and (existing.name == "Me" or not existing.name):
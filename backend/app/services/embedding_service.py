@@ -43,19 +43,24 @@ class EmbeddingService:
     async def embed_batch(
         self, texts: list[str], batch_size: int = 100
     ) -> list[list[float]]:
-        results: list[list[float]] = []
-        for i in range(0, len(texts), batch_size):
-            batch = [t.strip() for t in texts[i : i + batch_size]]
-            batch = [t if t else "empty" for t in batch]
-
-            async with self._semaphore:
-                resp = await self.client.embeddings.create(
-                    model=self.model,
-                    input=batch,
-                )
-                results.extend([d.embedding for d in resp.data])
-
-        return results
+        # All batches are scheduled at once; the semaphore caps in-flight
+        # requests and gather keeps results in input order
+        chunks = await asyncio.gather(*(
+            self._embed_chunk(texts[i : i + batch_size])
+            for i in range(0, len(texts), batch_size)
+        ))
+        return [embedding for chunk in chunks for embedding in chunk]
+
+    async def _embed_chunk(self, texts: list[str]) -> list[list[float]]:
+        batch = [t.strip() for t in texts]
+        batch = [t if t else "empty" for t in batch]
+
+        async with self._semaphore:
+            resp = await self.client.embeddings.create(
+                model=self.model,
+                input=batch,
+            )
+            return [d.embedding for d in resp.data]
 
 
 _embedding_service: EmbeddingService | None = None
@@ -1,25 +1,66 @@
 import base64
 import json
+import os
+from functools import lru_cache
 from typing import Any
 
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
 
 from app.config import settings
 
+# New ciphertexts are ChaCha20-Poly1305; anything without these markers is a
+# legacy Fernet token and still decrypts through the fallback branch
+V2_TEXT_PREFIX = "v2:"
+V2_BYTES_PREFIX = b"\x02"  # raw Fernet tokens always start with 0x80
+NONCE_SIZE = 12
 
-def _get_fernet() -> Fernet:
+
+def _key_bytes() -> bytes:
     key = settings.encryption_key.encode()
     if len(key) < 32:
         key = key.ljust(32, b"0")
-    key = base64.urlsafe_b64encode(key[:32])
-    return Fernet(key)
+    return key[:32]
+
+
+@lru_cache(maxsize=1)
+def _get_fernet() -> Fernet:
+    # encryption_key is fixed for the process lifetime, so derive it once
+    return Fernet(base64.urlsafe_b64encode(_key_bytes()))
+
+
+@lru_cache(maxsize=1)
+def _get_aead() -> ChaCha20Poly1305:
+    return ChaCha20Poly1305(_key_bytes())
+
+
+def _seal(tokens: dict[str, Any]) -> bytes:
+    nonce = os.urandom(NONCE_SIZE)
+    return nonce + _get_aead().encrypt(nonce, json.dumps(tokens).encode(), None)
+
+
+def _open(sealed: bytes) -> dict[str, Any]:
+    nonce, ciphertext = sealed[:NONCE_SIZE], sealed[NONCE_SIZE:]
+    return json.loads(_get_aead().decrypt(nonce, ciphertext, None))
 
 
 def encrypt_tokens(tokens: dict[str, Any]) -> str:
-    f = _get_fernet()
-    return f.encrypt(json.dumps(tokens).encode()).decode()
+    return V2_TEXT_PREFIX + base64.b64encode(_seal(tokens)).decode()
 
 
 def decrypt_tokens(encrypted: str) -> dict[str, Any]:
+    if encrypted.startswith(V2_TEXT_PREFIX):
+        return _open(base64.b64decode(encrypted[len(V2_TEXT_PREFIX):]))
     f = _get_fernet()
     return json.loads(f.decrypt(encrypted.encode()).decode())
+
+
+def encrypt_tokens_to_bytes(tokens: dict[str, Any]) -> bytes:
+    """Encrypt to raw bytes for BYTEA columns (no base64 text)."""
+    return V2_BYTES_PREFIX + _seal(tokens)
+
+
+def decrypt_tokens_from_bytes(encrypted: bytes) -> dict[str, Any]:
+    if encrypted.startswith(V2_BYTES_PREFIX):
+        return _open(encrypted[len(V2_BYTES_PREFIX):])
+    return json.loads(_get_fernet().decrypt(base64.urlsafe_b64encode(encrypted)).decode())
@@ -1,23 +1,67 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
+from collections import OrderedDict
 from typing import Any
 
+import numpy as np
 from sqlalchemy import select, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from thefuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from app.models.profile import Profile
 from app.services.embedding_service import EmbeddingService
 
 logger = logging.getLogger(__name__)
 
+FUZZY_CANDIDATES = 50
+FUZZY_THRESHOLD = 85
+# pg_trgm's default 0.3 drops short names that fuzz.ratio accepts
+# ("jon" / "john" is 0.29 trigram similarity, 85.7 ratio); pairs at or
+# above FUZZY_THRESHOLD stay well clear of this
+TRGM_PREFILTER_THRESHOLD = 0.1
+RESOLVE_CACHE_SIZE = 1024
+
+# Process-wide LRU of (lower(name), lower(email), type) -> matched entity.
+# Only matches to profiles the resolving service did not create itself go
+# in, so an entry never points at a row its session could still roll back
+_resolve_cache: OrderedDict[tuple[str, str, str], dict[str, Any]] = OrderedDict()
+
+
+def _cache_key(name: str, email: str | None, entity_type: str) -> tuple[str, str, str]:
+    return name.lower(), (email or "").lower(), entity_type
+
+
+def _cached_resolution(key: tuple[str, str, str]) -> dict[str, Any] | None:
+    match = _resolve_cache.get(key)
+    if match is not None:
+        _resolve_cache.move_to_end(key)
+    return match
+
+
+def _remember_resolution(key: tuple[str, str, str], match: dict[str, Any]) -> None:
+    _resolve_cache[key] = match
+    _resolve_cache.move_to_end(key)
+    if len(_resolve_cache) > RESOLVE_CACHE_SIZE:
+        _resolve_cache.popitem(last=False)
+
+
+def forget_resolutions(entity_id: str | None = None) -> None:
+    """Drop cached resolutions pointing at *entity_id*, or all of them."""
+    if entity_id is None:
+        _resolve_cache.clear()
+        return
+    for key in [k for k, match in _resolve_cache.items() if match["entity_id"] == entity_id]:
+        del _resolve_cache[key]
+
 
 class EntityResolutionService:
     def __init__(self, session: AsyncSession, embedding_service: EmbeddingService) -> None:
         self.session = session
         self.embedding_service = embedding_service
+        self._created: set[str] = set()
 
     async def resolve(self, raw_mention: dict[str, Any], meeting_id: str) -> dict[str, Any]:
         """Resolve a raw entity mention to a canonical entity.
@@ -34,16 +78,14 @@ class EntityResolutionService:
             entity_id = str(uuid.uuid4())
             return {"entity_id": entity_id, "name": "Unknown", "type": entity_type, "is_new": True}
 
-        match = await self.exact_match(name, email)
-        if match:
-            return {**match, "is_new": False}
-
-        match = await self.fuzzy_match(name)
-        if match:
-            return {**match, "is_new": False}
+        key = _cache_key(name, email, entity_type)
+        cached = _cached_resolution(key)
+        if cached:
+            return {**cached, "is_new": False}
 
-        match = await self.embedding_match(name)
+        match = await self._match(name, email)
         if match:
+            self._remember(key, match)
             return {**match, "is_new": False}
 
         entity_id = str(uuid.uuid4())
@@ -51,15 +93,246 @@ class EntityResolutionService:
             id=uuid.UUID(entity_id),
             type=entity_type,
             name=name,
-            email=email or "",
+            email=email or None,
             bio=None,
         )
         self.session.add(profile)
         await self.session.flush()
+        self._on_created([entity_id])
 
         logger.info("Created new entity: %s (%s)", name, entity_id)
         return {"entity_id": entity_id, "name": name, "type": entity_type, "is_new": True}
 
+    def _remember(self, key: tuple[str, str, str], match: dict[str, Any]) -> None:
+        if match["entity_id"] not in self._created:
+            _remember_resolution(key, {k: match[k] for k in ("entity_id", "name", "type")})
+
+    def _on_created(self, entity_ids: list[str]) -> None:
+        # A new profile can be a closer fuzzy or embedding match than what
+        # earlier mentions resolved to, so cached answers no longer hold
+        self._created.update(entity_ids)
+        forget_resolutions()
+
+    async def _match(self, name: str, email: str | None) -> dict[str, Any] | None:
+        match = await self.exact_match(name, email)
+        if match:
+            return match
+
+        # Exact hits are the common case and never pay for an embedding; past
+        # that, the request is network I/O that overlaps the fuzzy query
+        embed_task = asyncio.create_task(self.embedding_service.embed_text(name))
+        try:
+            match = await self.fuzzy_match(name)
+            if match:
+                return match
+
+            try:
+                embedding = await embed_task
+            except Exception:
+                logger.warning("Embedding generation failed for entity resolution, skipping")
+                return None
+            return await self.embedding_match(name, embedding)
+        finally:
+            if not embed_task.done():
+                embed_task.cancel()
+            elif not embed_task.cancelled():
+                embed_task.exception()  # mark retrieved so it isn't logged at GC
+
+    async def resolve_many(
+        self, raw_mentions: list[dict[str, Any]], meeting_id: str
+    ) -> list[dict[str, Any]]:
+        """Resolve a batch of mentions; results come back in input order.
+
+        Runs resolve()'s stages over the whole batch: one exact-match query,
+        one fuzzy candidate query scored as a single rapidfuzz cdist matrix,
+        then a single embed_batch request for the names the exact stage
+        missed, overlapping the fuzzy stage. Unmatched mentions become
+        profiles in one flush, and a mention whose email or name matches a
+        profile created earlier in the batch reuses it.
+        """
+        names = [m.get("name", "").strip() for m in raw_mentions]
+        emails = [m.get("email") or None for m in raw_mentions]
+        types = [m.get("entity_type", "contact") for m in raw_mentions]
+        keys = [_cache_key(n, e, t) for n, e, t in zip(names, emails, types)]
+        resolved: list[dict[str, Any] | None] = [None] * len(raw_mentions)
+
+        for i, name in enumerate(names):
+            if not name:
+                resolved[i] = {
+                    "entity_id": str(uuid.uuid4()), "name": "Unknown", "type": types[i], "is_new": True,
+                }
+            elif cached := _cached_resolution(keys[i]):
+                resolved[i] = {**cached, "is_new": False}
+
+        pending = [i for i in range(len(names)) if resolved[i] is None]
+        exact = await self._exact_match_many([(names[i], emails[i]) for i in pending])
+        for i, match in zip(pending, exact):
+            if match:
+                resolved[i] = {**match, "is_new": False}
+
+        pending = [i for i in pending if resolved[i] is None]
+        if pending:
+            embed_task = asyncio.create_task(
+                self.embedding_service.embed_batch([names[i] for i in pending])
+            )
+            try:
+                fuzzy = await self._fuzzy_match_many([names[i] for i in pending])
+                for i, match in zip(pending, fuzzy):
+                    if match:
+                        resolved[i] = {**match, "is_new": False}
+
+                if any(resolved[i] is None for i in pending):
+                    try:
+                        embeddings = dict(zip(pending, await embed_task))
+                    except Exception:
+                        logger.warning("Batch embedding failed for entity resolution, skipping")
+                        embeddings = {}
+                    for i, embedding in embeddings.items():
+                        if resolved[i] is None:
+                            match = await self.embedding_match(names[i], embedding)
+                            if match:
+                                resolved[i] = {**match, "is_new": False}
+            finally:
+                if not embed_task.done():
+                    embed_task.cancel()
+                elif not embed_task.cancelled():
+                    embed_task.exception()  # mark retrieved so it isn't logged at GC
+
+        created_by_email: dict[str, dict[str, Any]] = {}
+        created_by_name: dict[str, dict[str, Any]] = {}
+        new_profiles: list[Profile] = []
+        for i in pending:
+            if resolved[i] is not None:
+                continue
+            name, email = names[i], emails[i]
+            match = created_by_email.get(email.lower()) if email else None
+            if match is None and created_by_name:
+                hit = process.extractOne(
+                    name.lower(), list(created_by_name), scorer=fuzz.ratio, score_cutoff=FUZZY_THRESHOLD
+                )
+                match = created_by_name[hit[0]] if hit else None
+            if match:
+                resolved[i] = {**match, "is_new": False}
+                continue
+
+            entity_type = types[i]
+            entity_id = str(uuid.uuid4())
+            new_profiles.append(Profile(
+                id=uuid.UUID(entity_id),
+                type=entity_type,
+                name=name,
+                email=email,
+                bio=None,
+            ))
+            match = {"entity_id": entity_id, "name": name, "type": entity_type}
+            if email:
+                created_by_email[email.lower()] = match
+            created_by_name[name.lower()] = match
+            resolved[i] = {**match, "is_new": True}
+            logger.info("Created new entity: %s (%s)", name, entity_id)
+
+        if new_profiles:
+            self.session.add_all(new_profiles)
+            await self.session.flush()
+            self._on_created([str(p.id) for p in new_profiles])
+
+        for i in pending:
+            if not resolved[i]["is_new"]:
+                self._remember(keys[i], resolved[i])
+        return resolved
+
+    async def _exact_match_many(
+        self, keys: list[tuple[str, str | None]]
+    ) -> list[dict[str, Any] | None]:
+        # Same rules as exact_match: email when there is one, otherwise an
+        # org name; one query per rule for the whole batch
+        emails = {email.lower() for _, email in keys if email}
+        org_names = {name.lower() for name, email in keys if not email}
+        by_email: dict[str, dict[str, Any]] = {}
+        by_org: dict[str, dict[str, Any]] = {}
+
+        if emails:
+            stmt = (
+                select(Profile.id, Profile.name, Profile.type, Profile.email)
+                .where(func.lower(Profile.email).in_(emails))
+                .order_by(Profile.created_at)
+            )
+            for row in (await self.session.execute(stmt)).all():
+                by_email.setdefault(row.email.lower(), {
+                    "entity_id": str(row.id),
+                    "name": row.name,
+                    "type": row.type,
+                })
+
+        if org_names:
+            stmt = (
+                select(Profile.id, Profile.name, Profile.type)
+                .where(func.lower(Profile.name).in_(org_names), Profile.type == "org")
+                .order_by(Profile.created_at)
+            )
+            for row in (await self.session.execute(stmt)).all():
+                by_org.setdefault(row.name.lower(), {
+                    "entity_id": str(row.id),
+                    "name": row.name,
+                    "type": row.type,
+                })
+
+        return [
+            by_email.get(email.lower()) if email else by_org.get(name.lower())
+            for name, email in keys
+        ]
+
+    async def _fuzzy_match_many(
+        self, names: list[str], threshold: float = FUZZY_THRESHOLD
+    ) -> list[dict[str, Any] | None]:
+        # One LATERAL query takes each name's trigram candidates, then every
+        # name is scored against the pooled candidates as one cdist matrix
+        needles = [n.lower() for n in names]
+        await self.session.execute(
+            text("SELECT set_config('pg_trgm.similarity_threshold', :limit, true)"),
+            {"limit": str(TRGM_PREFILTER_THRESHOLD)},
+        )
+        stmt = text("""
+            SELECT DISTINCT c.id, c.name, c.type
+            FROM unnest(CAST(:needles AS text[])) AS n(needle)
+            CROSS JOIN LATERAL (
+                SELECT p.id, p.name, p.type
+                FROM profiles p
+                WHERE p.type IN ('contact', 'self', 'org')
+                  AND lower(p.name) % n.needle
+                ORDER BY similarity(lower(p.name), n.needle) DESC
+                LIMIT :candidates
+            ) c
+        """)
+        candidates = (await self.session.execute(
+            stmt, {"needles": sorted(set(needles)), "candidates": FUZZY_CANDIDATES}
+        )).all()
+        if not candidates:
+            return [None] * len(names)
+
+        scores = process.cdist(
+            needles,
+            [c.name.lower() for c in candidates],
+            scorer=fuzz.ratio,
+            score_cutoff=threshold,
+            dtype=np.uint8,
+            workers=-1,
+        )
+        hits: list[dict[str, Any] | None] = []
+        for name, row, col in zip(names, scores, scores.argmax(axis=1)):
+            # cdist zeroes scores below the cutoff
+            if row[col] == 0:
+                hits.append(None)
+                continue
+            match = candidates[col]
+            logger.info("Fuzzy matched '%s' -> '%s' (score=%d)", name, match.name, row[col])
+            hits.append({
+                "entity_id": str(match.id),
+                "name": match.name,
+                "type": match.type,
+            })
+        return hits
+
     async def exact_match(self, name: str, email: str | None) -> dict[str, Any] | None:
         if email:
             stmt = select(Profile).where(
@@ -91,21 +364,36 @@ class EntityResolutionService:
 
         return None
 
-    async def fuzzy_match(self, name: str, threshold: float = 85) -> dict[str, Any] | None:
-        stmt = select(Profile).where(Profile.type.in_(["contact", "self", "org"]))
-        result = await self.session.execute(stmt)
-        profiles = result.scalars().all()
-
-        best_match = None
-        best_score = 0
-
-        for profile in profiles:
-            score = fuzz.ratio(name.lower(), profile.name.lower())
-            if score >= threshold and score > best_score:
-                best_score = score
-                best_match = profile
+    async def fuzzy_match(self, name: str, threshold: float = FUZZY_THRESHOLD) -> dict[str, Any] | None:
+        # pg_trgm narrows the profile table to similar names via the trigram
+        # index; fuzz.ratio then picks among those candidates. The % cutoff is
+        # lowered for this transaction so it stays a superset of the ratio rule
+        needle = name.lower()
+        await self.session.execute(
+            text("SELECT set_config('pg_trgm.similarity_threshold', :limit, true)"),
+            {"limit": str(TRGM_PREFILTER_THRESHOLD)},
+        )
+        lowered = func.lower(Profile.name)
+        stmt = (
+            select(Profile.id, Profile.name, Profile.type)
+            .where(
+                Profile.type.in_(["contact", "self", "org"]),
+                lowered.op("%")(needle),
+            )
+            .order_by(func.similarity(lowered, needle).desc())
+            .limit(FUZZY_CANDIDATES)
+        )
+        candidates = (await self.session.execute(stmt)).all()
 
-        if best_match:
+        hit = process.extractOne(
+            needle,
+            [c.name.lower() for c in candidates],
+            scorer=fuzz.ratio,
+            score_cutoff=threshold,
+        )
+        if hit:
+            _, best_score, index = hit
+            best_match = candidates[index]
             logger.info("Fuzzy matched '%s' -> '%s' (score=%d)", name, best_match.name, best_score)
             return {
                 "entity_id": str(best_match.id),
@@ -116,31 +404,22 @@ class EntityResolutionService:
         return None
 
     async def embedding_match(
-        self, text: str, threshold: float = 0.88
+        self, name: str, embedding: list[float], threshold: float = 0.88
     ) -> dict[str, Any] | None:
-        try:
-            embedding = await self.embedding_service.embed_text(text)
-        except Exception:
-            logger.warning("Embedding generation failed for entity resolution, skipping")
-            return None
-
-        stmt = text("""
-            SELECT id, name, type, embedding <=> :embedding AS distance
-            FROM profiles
-            WHERE embedding IS NOT NULL
-            ORDER BY embedding <=> :embedding
-            LIMIT 1
-        """)
-
-        result = await self.session.execute(
-            stmt, {"embedding": str(embedding)}
+        distance = Profile.embedding.cosine_distance(embedding).label("distance")
+        stmt = (
+            select(Profile.id, Profile.name, Profile.type, distance)
+            .where(Profile.embedding.isnot(None))
+            .order_by(distance)
+            .limit(1)
         )
+        result = await self.session.execute(stmt)
         row = result.first()
 
         if row and (1 - row.distance) >= threshold:
             logger.info(
                 "Embedding matched '%s' -> '%s' (similarity=%.3f)",
-                text, row.name, 1 - row.distance,
+                name, row.name, 1 - row.distance,
             )
             return {
                 "entity_id": str(row.id),
@@ -152,4 +431,5 @@ class EntityResolutionService:
 
     async def merge_entities(self, source_id: str, target_id: str) -> None:
         """Merge source entity into target. Updates all references."""
+        forget_resolutions(source_id)
         raise NotImplementedError("Manual merge not yet implemented")
@@ -1,43 +1,109 @@
 from __future__ import annotations
 
+import base64
 import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func, select
+from pgvector import HalfVector
+from sqlalchemy import func, insert, or_, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, selectinload
 
-from app.models.meeting import Attendee, Meeting, TranscriptChunk
+from app.models.action_item import ActionItem
+from app.models.meeting import Attendee, Meeting, TranscriptChunk, TranscriptChunkEmbedding
+
+CHUNK_UPSERT_COLUMNS = ("speaker", "content", "start_time", "end_time")
+
+
+def _encode_cursor(meeting: Meeting) -> str:
+    raw = f"{meeting.date.isoformat()}|{meeting.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Raises ValueError for a cursor this service didn't issue."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        date_part, id_part = raw.split("|", 1)
+        return datetime.fromisoformat(date_part), uuid.UUID(id_part)
+    except ValueError as exc:  # covers binascii.Error and UnicodeDecodeError
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
 
 
 class MeetingService:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def list_meetings(self, page: int = 1, page_size: int = 20) -> dict[str, Any]:
-        total_stmt = select(func.count()).select_from(Meeting)
-        total = (await self.session.execute(total_stmt)).scalar() or 0
+    async def list_meetings(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: str | None = None,
+        exact_count: bool = False,
+    ) -> dict[str, Any]:
+        """List meetings newest first.
 
-        offset = (page - 1) * page_size
-        stmt = (
-            select(Meeting)
-            .options(selectinload(Meeting.attendees), selectinload(Meeting.action_items))
-            .order_by(Meeting.date.desc())
-            .offset(offset)
+        Pass the previous response's next_cursor to page by keyset on
+        (date, id) instead of OFFSET. total is the planner's row estimate
+        unless exact_count is set.
+        """
+        # One round-trip: page the meeting ids in a subquery, join attendees
+        # onto that page, and count action items with a correlated subquery
+        page_ids = (
+            select(Meeting.id)
+            .order_by(Meeting.date.desc(), Meeting.id.desc())
             .limit(page_size)
         )
+        if cursor:
+            last_date, last_id = _decode_cursor(cursor)
+            page_ids = page_ids.where(
+                tuple_(Meeting.date, Meeting.id) < tuple_(last_date, last_id)
+            )
+        else:
+            page_ids = page_ids.offset((page - 1) * page_size)
+        page_ids = page_ids.subquery()
+
+        action_items_count = (
+            select(func.count(ActionItem.id))
+            .where(ActionItem.meeting_id == Meeting.id)
+            .correlate(Meeting)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(Meeting, action_items_count)
+            .join(page_ids, page_ids.c.id == Meeting.id)
+            .outerjoin(Meeting.attendees)
+            .options(contains_eager(Meeting.attendees))
+            .order_by(Meeting.date.desc(), Meeting.id.desc())
+        )
         result = await self.session.execute(stmt)
-        meetings = result.scalars().all()
+        rows = result.unique().all()
+
+        total = await self._count_meetings(exact_count)
+        next_cursor = _encode_cursor(rows[-1][0]) if len(rows) == page_size else None
 
         return {
-            "items": [self._meeting_to_dict(m) for m in meetings],
+            "items": [self._meeting_to_dict(m, count) for m, count in rows],
             "total": total,
             "page": page,
             "page_size": page_size,
             "total_pages": (total + page_size - 1) // page_size,
+            "next_cursor": next_cursor,
         }
 
+    async def _count_meetings(self, exact: bool) -> int:
+        if not exact:
+            # reltuples is kept current by autovacuum/ANALYZE; -1 means never analyzed
+            estimate = (await self.session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'meetings'::regclass")
+            )).scalar()
+            if estimate is not None and estimate >= 0:
+                return estimate
+        total_stmt = select(func.count()).select_from(Meeting)
+        return (await self.session.execute(total_stmt)).scalar() or 0
+
     async def get_meeting(self, meeting_id: str) -> dict[str, Any] | None:
         stmt = (
             select(Meeting)
@@ -87,23 +153,27 @@ class MeetingService:
             )
             self.session.add(meeting)
 
-        await self.session.flush()
-
+        # No explicit flushes: the meeting id is assigned client-side and the
+        # attendee statements below autoflush the pending meeting row first
         if "attendees" in meeting_data:
             from sqlalchemy import delete
             await self.session.execute(
                 delete(Attendee).where(Attendee.meeting_id == meeting.id)
             )
-            for att_data in meeting_data["attendees"]:
-                attendee = Attendee(
-                    meeting_id=meeting.id,
-                    name=att_data["name"],
-                    email=att_data.get("email"),
-                    role=att_data.get("role"),
+            if meeting_data["attendees"]:
+                await self.session.execute(
+                    insert(Attendee),
+                    [
+                        {
+                            "meeting_id": meeting.id,
+                            "name": att_data["name"],
+                            "email": att_data.get("email"),
+                            "role": att_data.get("role"),
+                        }
+                        for att_data in meeting_data["attendees"]
+                    ],
                 )
-                self.session.add(attendee)
 
-        await self.session.flush()
         return str(meeting.id)
 
     async def meeting_exists_by_granola_id(self, granola_id: str) -> bool:
@@ -114,34 +184,65 @@ class MeetingService:
     async def store_transcript_chunks(
         self, meeting_id: str, chunks: list[dict[str, Any]]
     ) -> int:
+        """Upsert chunks by (meeting_id, chunk_index) and prune the leftovers.
+
+        Unchanged chunks are skipped at the conflict check, so a re-sync of
+        the same transcript rewrites nothing and keeps existing embeddings.
+        """
         from sqlalchemy import delete
-        await self.session.execute(
-            delete(TranscriptChunk).where(TranscriptChunk.meeting_id == uuid.UUID(meeting_id))
-        )
-        for chunk_data in chunks:
-            chunk = TranscriptChunk(
-                meeting_id=uuid.UUID(meeting_id),
-                chunk_index=chunk_data["chunk_index"],
-                speaker=chunk_data.get("speaker"),
-                content=chunk_data["content"],
-                start_time=chunk_data.get("start_time"),
-                end_time=chunk_data.get("end_time"),
+        mid = uuid.UUID(meeting_id)
+        prune = delete(TranscriptChunk).where(TranscriptChunk.meeting_id == mid)
+        if chunks:
+            stmt = pg_insert(TranscriptChunk)
+            changed = [
+                getattr(TranscriptChunk, col).is_distinct_from(getattr(stmt.excluded, col))
+                for col in CHUNK_UPSERT_COLUMNS
+            ]
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["meeting_id", "chunk_index"],
+                set_={
+                    **{col: getattr(stmt.excluded, col) for col in CHUNK_UPSERT_COLUMNS},
+                    "updated_at": func.now(),
+                },
+                where=or_(*changed),
+            ).returning(TranscriptChunk.id)
+            rewritten = (await self.session.scalars(
+                stmt,
+                [
+                    {
+                        "meeting_id": mid,
+                        "chunk_index": chunk_data["chunk_index"],
+                        "speaker": chunk_data.get("speaker"),
+                        "content": chunk_data["content"],
+                        "start_time": chunk_data.get("start_time"),
+                        "end_time": chunk_data.get("end_time"),
+                    }
+                    for chunk_data in chunks
+                ],
+            )).all()
+            # Inserted or rewritten chunks: drop any embedding of the old text
+            if rewritten:
+                await self.session.execute(
+                    delete(TranscriptChunkEmbedding).where(
+                        TranscriptChunkEmbedding.chunk_id.in_(rewritten)
+                    )
+                )
+            prune = prune.where(
+                TranscriptChunk.chunk_index.not_in([c["chunk_index"] for c in chunks])
             )
-            self.session.add(chunk)
-        await self.session.flush()
+        await self.session.execute(prune)
         return len(chunks)
 
     async def update_meeting_embedding(
         self, meeting_id: str, embedding: list[float]
     ) -> None:
-        stmt = select(Meeting).where(Meeting.id == meeting_id)
-        result = await self.session.execute(stmt)
-        meeting = result.scalar_one_or_none()
-        if meeting:
-            meeting.embedding = embedding
-            await self.session.flush()
+        await self.session.execute(
+            update(Meeting)
+            .where(Meeting.id == uuid.UUID(meeting_id))
+            .values(embedding=HalfVector(embedding))
+        )
 
-    def _meeting_to_dict(self, m: Meeting) -> dict[str, Any]:
+    def _meeting_to_dict(self, m: Meeting, action_items_count: int) -> dict[str, Any]:
         return {
             "id": str(m.id),
             "granola_id": m.granola_id,
@@ -155,11 +256,11 @@ class MeetingService:
                 {"id": str(a.id), "name": a.name, "email": a.email, "role": a.role}
                 for a in (m.attendees or [])
             ],
-            "action_items_count": len(m.action_items) if m.action_items else 0,
+            "action_items_count": action_items_count,
         }
 
     def _meeting_detail_to_dict(self, m: Meeting) -> dict[str, Any]:
-        d = self._meeting_to_dict(m)
+        d = self._meeting_to_dict(m, len(m.action_items or []))
         d["raw_notes"] = m.raw_notes
         d["enhanced_notes"] = m.enhanced_notes
         d["next_call_brief"] = m.next_call_brief
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import logging
 import uuid
+from functools import lru_cache
 from typing import Any
 
 from neo4j import AsyncDriver
+from neo4j.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +15,160 @@ VALID_RELATIONSHIP_TYPES = {
     "ATTENDED", "DISCUSSED", "WORKS_AT", "KNOWS",
     "ASSIGNED_TO", "RELATES_TO", "MENTIONED_IN",
 }
+MAX_CONNECTION_DEPTH = 3
+MAX_CONNECTION_EDGES = 200
+
+# Labels and relationship types can't be Cypher parameters, so every query
+# is built from a fixed template: the text is stable per label and Neo4j
+# reuses its cached plan instead of re-planning each call.
+_CREATE_ENTITY_QUERIES = {
+    t: f"MERGE (e:{t} {{id: $id}}) SET e += $props RETURN e"
+    for t in VALID_ENTITY_TYPES
+}
+
+# Relationships are capped before aggregation and nodes come only from the
+# kept relationships, so a dense neighbourhood can't grow the response
+_CONNECTIONS_PROJECTION = """
+    UNWIND rels AS r
+    UNWIND [startNode(r), endNode(r)] AS n
+    WITH rels, collect(DISTINCT n) AS nodes
+    RETURN
+        [n IN nodes | {
+            id: n.id, label: COALESCE(n.name, n.title, n.id), type: labels(n)[0]
+        }] AS nodes,
+        [r IN rels | {
+            source: startNode(r).id, target: endNode(r).id,
+            type: type(r), properties: properties(r)
+        }] AS edges
+"""
+
+# Distinct relationships in one row; depth is a parameter, so a single plan
+# serves every depth. The limit also bounds how far APOC expands
+_CONNECTIONS_APOC_QUERY = """
+    MATCH (e {id: $entity_id})
+    CALL apoc.path.subgraphAll(e, {maxLevel: $depth, relationshipFilter: '>', limit: $limit})
+    YIELD relationships
+    WITH relationships[..$limit] AS rels
+""" + _CONNECTIONS_PROJECTION
+
+# Without APOC: one template per depth. DISTINCT + LIMIT streams, so path
+# expansion stops once enough distinct relationships are found
+_CONNECTIONS_QUERIES = {
+    depth: f"""
+    MATCH (e {{id: $entity_id}})-[path_rels*1..{depth}]->()
+    UNWIND path_rels AS r
+    WITH DISTINCT r LIMIT $limit
+    WITH collect(r) AS rels
+    """ + _CONNECTIONS_PROJECTION
+    for depth in range(1, MAX_CONNECTION_DEPTH + 1)
+}
+
+# None until the first connections query finds out whether APOC is installed
+_apoc_available: bool | None = None
+
+
+_GRAPH_LABELS = {
+    "person": "Person",
+    "organization": "Organization",
+    "topic": "Topic",
+    "project": "Project",
+}
+
+
+def _graph_query(node_match: str) -> str:
+    # Edges are matched from the selected nodes and kept only when the other
+    # end is in the same set, so nothing outside the page crosses the wire
+    return f"""
+    {node_match}
+    WITH n LIMIT $limit
+    WITH collect(n) AS ns
+    UNWIND ns AS a
+    OPTIONAL MATCH (a)-[r]->(b)
+    WHERE b IN ns
+    WITH ns, collect(CASE WHEN r IS NOT NULL THEN {{
+        source: a.id, target: b.id, type: type(r), props: properties(r)
+    }} END) AS edges
+    RETURN
+        [n IN ns | {{
+            type: labels(n)[0], id: n.id,
+            name: COALESCE(n.name, n.title, n.id), props: properties(n)
+        }}] AS nodes,
+        edges[..$edge_limit] AS edges
+    """
+
+
+_GRAPH_QUERIES = {
+    None: _graph_query(
+        "MATCH (n) WHERE n:Person OR n:Organization OR n:Topic OR n:Project"
+    ),
+    **{label: _graph_query(f"MATCH (n:{label})") for label in _GRAPH_LABELS.values()},
+}
+
+
+_CREATE_ENTITIES_BATCH_QUERIES = {
+    t: f"UNWIND $rows AS row MERGE (e:{t} {{id: row.id}}) SET e += row.props"
+    for t in VALID_ENTITY_TYPES
+}
+
+
+def _check_labels(from_type: str, to_type: str, rel_type: str) -> None:
+    if from_type not in VALID_ENTITY_TYPES:
+        raise ValueError(f"Invalid entity type: {from_type}")
+    if to_type not in VALID_ENTITY_TYPES:
+        raise ValueError(f"Invalid entity type: {to_type}")
+    if rel_type not in VALID_RELATIONSHIP_TYPES:
+        raise ValueError(f"Invalid relationship type: {rel_type}")
+
+
+@lru_cache(maxsize=None)
+def _create_relationship_query(from_type: str, to_type: str, rel_type: str) -> str:
+    _check_labels(from_type, to_type, rel_type)
+    return f"""
+    MATCH (a:{from_type} {{id: $from_id}})
+    MATCH (b:{to_type} {{id: $to_id}})
+    MERGE (a)-[r:{rel_type}]->(b)
+    SET r.id = $rel_id, r += $props
+    RETURN r, type(r) as type
+    """
+
+
+@lru_cache(maxsize=None)
+def _strengthen_relationship_query(from_type: str, to_type: str, rel_type: str) -> str:
+    _check_labels(from_type, to_type, rel_type)
+    return f"""
+    MATCH (a:{from_type} {{id: $from_id}})
+    MATCH (b:{to_type} {{id: $to_id}})
+    MERGE (a)-[r:{rel_type}]->(b)
+    ON CREATE SET r.strength = 1, r.first_seen = $last_seen, r.last_seen = $last_seen, r.context = $context, r.id = $rel_id
+    ON MATCH SET r.strength = coalesce(r.strength, 0) + 1, r.last_seen = $last_seen, r.context = $context
+    RETURN r
+    """
+
+
+@lru_cache(maxsize=None)
+def _create_relationships_batch_query(from_type: str, to_type: str, rel_type: str) -> str:
+    _check_labels(from_type, to_type, rel_type)
+    return f"""
+    UNWIND $rows AS row
+    MATCH (a:{from_type} {{id: row.from_id}})
+    MATCH (b:{to_type} {{id: row.to_id}})
+    MERGE (a)-[r:{rel_type}]->(b)
+    SET r.id = row.rel_id, r += row.props
+    """
+
+
+@lru_cache(maxsize=None)
+def _strengthen_relationships_batch_query(from_type: str, to_type: str, rel_type: str) -> str:
+    _check_labels(from_type, to_type, rel_type)
+    return f"""
+    UNWIND $rows AS row
+    MATCH (a:{from_type} {{id: row.from_id}})
+    MATCH (b:{to_type} {{id: row.to_id}})
+    MERGE (a)-[r:{rel_type}]->(b)
+    ON CREATE SET r.strength = 1, r.first_seen = row.last_seen, r.last_seen = row.last_seen, r.context = row.context, r.id = row.rel_id
+    ON MATCH SET r.strength = coalesce(r.strength, 0) + 1, r.last_seen = row.last_seen, r.context = row.context
+    RETURN r.strength as strength
+    """
 
 
 class Neo4jService:
@@ -25,19 +181,12 @@ class Neo4jService:
         if entity_type not in VALID_ENTITY_TYPES:
             raise ValueError(f"Invalid entity type: {entity_type}")
 
-        props = {k: v for k, v in properties.items() if v is not None}
-        props["id"] = entity_id
-
-        set_clause = ", ".join(f"e.{k} = ${k}" for k in props if k != "id")
-
-        query = f"""
-        MERGE (e:{entity_type} {{id: $id}})
-        {f'SET {set_clause}' if set_clause else ''}
-        RETURN e
-        """
+        props = {k: v for k, v in properties.items() if v is not None and k != "id"}
 
         async with self.driver.session() as session:
-            result = await session.run(query, **props)
+            result = await session.run(
+                _CREATE_ENTITY_QUERIES[entity_type], id=entity_id, props=props
+            )
             record = await result.single()
             return dict(record["e"]) if record else {}
 
@@ -50,27 +199,13 @@ class Neo4jService:
         rel_type: str,
         properties: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        if rel_type not in VALID_RELATIONSHIP_TYPES:
-            raise ValueError(f"Invalid relationship type: {rel_type}")
-
-        props = properties or {}
+        query = _create_relationship_query(from_type, to_type, rel_type)
+        props = dict(properties or {})
         rel_id = props.pop("id", str(uuid.uuid4()))
 
-        set_parts = ["r.id = $rel_id"]
-        for k in props:
-            set_parts.append(f"r.{k} = ${k}")
-
-        query = f"""
-        MATCH (a:{from_type} {{id: $from_id}})
-        MATCH (b:{to_type} {{id: $to_id}})
-        MERGE (a)-[r:{rel_type}]->(b)
-        SET {', '.join(set_parts)}
-        RETURN r, type(r) as type
-        """
-
         async with self.driver.session() as session:
             result = await session.run(
-                query, from_id=from_id, to_id=to_id, rel_id=rel_id, **props
+                query, from_id=from_id, to_id=to_id, rel_id=rel_id, props=props
             )
             record = await result.single()
             if record:
@@ -88,14 +223,7 @@ class Neo4jService:
         last_seen: str | None = None,
     ) -> dict[str, Any]:
         """Increment strength on an existing relationship, create if missing."""
-        query = f"""
-        MATCH (a:{from_type} {{id: $from_id}})
-        MATCH (b:{to_type} {{id: $to_id}})
-        MERGE (a)-[r:{rel_type}]->(b)
-        ON CREATE SET r.strength = 1, r.first_seen = $last_seen, r.last_seen = $last_seen, r.context = $context, r.id = $rel_id
-        ON MATCH SET r.strength = coalesce(r.strength, 0) + 1, r.last_seen = $last_seen, r.context = $context
-        RETURN r
-        """
+        query = _strengthen_relationship_query(from_type, to_type, rel_type)
 
         async with self.driver.session() as session:
             result = await session.run(
@@ -109,6 +237,84 @@ class Neo4jService:
             record = await result.single()
             return dict(record["r"]) if record else {}
 
+    async def create_entities_batch(
+        self, entity_type: str, entities: list[dict[str, Any]]
+    ) -> None:
+        """MERGE many nodes of one label in a single UNWIND round-trip.
+
+        Each entity is {"id": ..., "props": {...}}; None props are skipped
+        as in create_entity.
+        """
+        if entity_type not in VALID_ENTITY_TYPES:
+            raise ValueError(f"Invalid entity type: {entity_type}")
+        if not entities:
+            return
+        rows = [
+            {
+                "id": e["id"],
+                "props": {k: v for k, v in e.get("props", {}).items() if v is not None and k != "id"},
+            }
+            for e in entities
+        ]
+        await self._write(_CREATE_ENTITIES_BATCH_QUERIES[entity_type], rows)
+
+    async def create_relationships_batch(
+        self,
+        from_type: str,
+        to_type: str,
+        rel_type: str,
+        links: list[dict[str, Any]],
+    ) -> None:
+        """Batched create_relationship; each link is {"from_id", "to_id", "props"}."""
+        query = _create_relationships_batch_query(from_type, to_type, rel_type)
+        if not links:
+            return
+        rows = []
+        for link in links:
+            props = dict(link.get("props") or {})
+            rows.append({
+                "from_id": link["from_id"],
+                "to_id": link["to_id"],
+                "rel_id": props.pop("id", str(uuid.uuid4())),
+                "props": props,
+            })
+        await self._write(query, rows)
+
+    async def strengthen_relationships_batch(
+        self,
+        from_type: str,
+        to_type: str,
+        rel_type: str,
+        links: list[dict[str, Any]],
+    ) -> list[int]:
+        """Batched strengthen_relationship; returns the resulting strengths.
+
+        Each link is {"from_id", "to_id", "context", "last_seen"}.
+        """
+        query = _strengthen_relationships_batch_query(from_type, to_type, rel_type)
+        if not links:
+            return []
+        rows = [
+            {
+                "from_id": link["from_id"],
+                "to_id": link["to_id"],
+                "context": link.get("context") or "",
+                "last_seen": link.get("last_seen") or "",
+                "rel_id": str(uuid.uuid4()),
+            }
+            for link in links
+        ]
+        records = await self._write(query, rows)
+        return [r["strength"] for r in records]
+
+    async def _write(self, query: str, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        async def _tx(tx) -> list[dict[str, Any]]:
+            result = await tx.run(query, rows=rows)
+            return [r.data() async for r in result]
+
+        async with self.driver.session() as session:
+            return await session.execute_write(_tx)
+
     async def create_meeting_node(
         self, meeting_id: str, title: str, date: str
     ) -> dict[str, Any]:
@@ -125,135 +331,102 @@ class Neo4jService:
     async def get_entity_connections(
         self, entity_id: str, depth: int = 1
     ) -> dict[str, Any]:
-        query = """
-        MATCH (e {id: $entity_id})-[r*1..""" + str(depth) + """]->(connected)
-        WITH e, r, connected
-        UNWIND r as rel
-        RETURN
-            labels(e)[0] as source_type, e.id as source_id,
-            COALESCE(e.name, e.title, e.id) as source_name,
-            type(rel) as rel_type, properties(rel) as rel_props,
-            labels(connected)[0] as target_type, connected.id as target_id,
-            COALESCE(connected.name, connected.title, connected.id) as target_name
-        LIMIT 200
-        """
+        global _apoc_available
+        depth = max(1, min(depth, MAX_CONNECTION_DEPTH))
         async with self.driver.session() as session:
-            result = await session.run(query, entity_id=entity_id)
-            records = [r async for r in result]
+            record = None
+            if _apoc_available is not False:
+                try:
+                    result = await session.run(
+                        _CONNECTIONS_APOC_QUERY,
+                        entity_id=entity_id, depth=depth, limit=MAX_CONNECTION_EDGES,
+                    )
+                    record = await result.single()
+                    _apoc_available = True
+                except ClientError as exc:
+                    if exc.code != "Neo.ClientError.Procedure.ProcedureNotFound":
+                        raise
+                    logger.info("APOC not installed, using plain Cypher for connections")
+                    _apoc_available = False
+            if not _apoc_available:
+                result = await session.run(
+                    _CONNECTIONS_QUERIES[depth], entity_id=entity_id, limit=MAX_CONNECTION_EDGES
+                )
+                record = await result.single()
+
+        if record is None:
+            return {"nodes": [], "edges": []}
 
-        nodes: dict[str, dict] = {}
-        edges: list[dict] = []
-
-        for record in records:
-            src_id = record["source_id"]
-            tgt_id = record["target_id"]
-
-            if src_id not in nodes:
-                nodes[src_id] = {
-                    "id": src_id,
-                    "label": record["source_name"] or src_id,
-                    "type": record["source_type"].lower(),
-                }
-            if tgt_id not in nodes:
-                nodes[tgt_id] = {
-                    "id": tgt_id,
-                    "label": record["target_name"] or tgt_id,
-                    "type": record["target_type"].lower(),
-                }
-
-            edges.append({
-                "id": f"{src_id}-{record['rel_type']}-{tgt_id}",
-                "source": src_id,
-                "target": tgt_id,
-                "type": record["rel_type"],
-                "properties": record["rel_props"] or {},
-            })
+        nodes = [
+            {"id": n["id"], "label": n["label"] or n["id"], "type": n["type"].lower()}
+            for n in record["nodes"]
+        ]
+        edges = [
+            {
+                "id": f"{e['source']}-{e['type']}-{e['target']}",
+                "source": e["source"],
+                "target": e["target"],
+                "type": e["type"],
+                "properties": e["properties"] or {},
+            }
+            for e in record["edges"]
+        ]
 
-        return {"nodes": list(nodes.values()), "edges": edges}
+        return {"nodes": nodes, "edges": edges}
 
     async def get_graph_data(
         self, limit: int = 100, node_type: str | None = None
     ) -> dict[str, Any]:
         """Get nodes and edges for graph visualization, optionally filtered by type."""
-        type_map = {
-            "person": "Person",
-            "organization": "Organization",
-            "topic": "Topic",
-            "project": "Project",
-        }
-
-        if node_type and node_type.lower() in type_map:
-            label = type_map[node_type.lower()]
-            node_query = f"""
-            MATCH (n:{label})
-            RETURN labels(n)[0] as type, n.id as id,
-                   COALESCE(n.name, n.title, n.id) as name, properties(n) as props
-            LIMIT $limit
-            """
-            edge_query = f"""
-            MATCH (a:{label})-[r]->(b:{label})
-            RETURN a.id as source, b.id as target, type(r) as type, properties(r) as props
-            LIMIT $edge_limit
-            """
-        else:
-            node_query = """
-            MATCH (n)
-            WHERE n:Person OR n:Organization OR n:Topic OR n:Project
-            RETURN labels(n)[0] as type, n.id as id,
-                   COALESCE(n.name, n.title, n.id) as name, properties(n) as props
-            LIMIT $limit
-            """
-            edge_query = """
-            MATCH (a)-[r]->(b)
-            WHERE (a:Person OR a:Organization OR a:Topic OR a:Project OR a:Meeting)
-              AND (b:Person OR b:Organization OR b:Topic OR b:Project OR b:Meeting)
-            RETURN a.id as source, b.id as target, type(r) as type, properties(r) as props
-            LIMIT $edge_limit
-            """
+        label = _GRAPH_LABELS.get(node_type.lower()) if node_type else None
 
         async with self.driver.session() as session:
-            node_result = await session.run(node_query, limit=limit)
-            node_records = [r async for r in node_result]
+            result = await session.run(
+                _GRAPH_QUERIES[label], limit=limit, edge_limit=limit * 3
+            )
+            record = await result.single()
 
-            edge_result = await session.run(edge_query, edge_limit=limit * 3)
-            edge_records = [r async for r in edge_result]
+        if record is None:
+            return {"nodes": [], "edges": []}
 
         nodes = [
             {
-                "id": r["id"],
-                "label": r["name"] or r["id"],
-                "type": r["type"].lower(),
-                "properties": r["props"] or {},
+                "id": n["id"],
+                "label": n["name"] or n["id"],
+                "type": n["type"].lower(),
+                "properties": n["props"] or {},
             }
-            for r in node_records
+            for n in record["nodes"]
         ]
-
-        node_ids = {n["id"] for n in nodes}
         edges = [
             {
-                "id": f"{r['source']}-{r['type']}-{r['target']}",
-                "source": r["source"],
-                "target": r["target"],
-                "type": r["type"],
-                "properties": r["props"] or {},
+                "id": f"{e['source']}-{e['type']}-{e['target']}",
+                "source": e["source"],
+                "target": e["target"],
+                "type": e["type"],
+                "properties": e["props"] or {},
             }
-            for r in edge_records
-            if r["source"] in node_ids and r["target"] in node_ids
+            for e in record["edges"]
         ]
 
         return {"nodes": nodes, "edges": edges}
 
     async def get_entity_with_neighbors(self, entity_id: str) -> dict[str, Any]:
         """Get an entity and all its immediate neighbors (depth 1, both directions)."""
+        # One undirected match, projected to plain maps so the driver doesn't
+        # ship and hydrate full Node/Relationship objects
         query = """
         MATCH (e {id: $entity_id})
-        OPTIONAL MATCH (e)-[r_out]->(neighbor_out)
-        OPTIONAL MATCH (e)<-[r_in]-(neighbor_in)
-        WITH e,
-             collect(DISTINCT {rel: r_out, node: neighbor_out, dir: 'out'}) as outs,
-             collect(DISTINCT {rel: r_in, node: neighbor_in, dir: 'in'}) as ins
-        RETURN e, labels(e)[0] as entity_type, properties(e) as entity_props,
-               outs, ins
+        OPTIONAL MATCH (e)-[r]-(n)
+        WITH e, collect(CASE WHEN r IS NULL THEN null ELSE {
+            outgoing: startNode(r) = e,
+            rel_type: type(r),
+            rel_props: properties(r),
+            id: n.id,
+            type: labels(n)[0],
+            props: properties(n)
+        } END) as links
+        RETURN labels(e)[0] as entity_type, properties(e) as entity_props, links
         """
         async with self.driver.session() as session:
             result = await session.run(query, entity_id=entity_id)
@@ -273,54 +446,26 @@ class Neo4jService:
         neighbors: dict[str, dict] = {}
         edges: list[dict] = []
 
-        for item in record["outs"]:
-            rel = item["rel"]
-            node = item["node"]
-            if rel is None or node is None:
-                continue
-            nprops = dict(node)
-            nid = nprops.get("id", "")
-            if not nid:
-                continue
-            labels = list(node.labels) if hasattr(node, "labels") else []
-            ntype = labels[0].lower() if labels else "unknown"
-            neighbors[nid] = {
-                "id": nid,
-                "label": nprops.get("name") or nprops.get("title") or nid,
-                "type": ntype,
-                "properties": nprops,
-            }
-            edges.append({
-                "id": f"{entity_id}-{rel.type}-{nid}",
-                "source": entity_id,
-                "target": nid,
-                "type": rel.type,
-                "properties": dict(rel),
-            })
-
-        for item in record["ins"]:
-            rel = item["rel"]
-            node = item["node"]
-            if rel is None or node is None:
-                continue
-            nprops = dict(node)
-            nid = nprops.get("id", "")
+        for link in record["links"]:
+            nid = link["id"]
             if not nid:
                 continue
-            labels = list(node.labels) if hasattr(node, "labels") else []
-            ntype = labels[0].lower() if labels else "unknown"
+            nprops = link["props"]
+            ntype = link["type"]
             neighbors[nid] = {
                 "id": nid,
                 "label": nprops.get("name") or nprops.get("title") or nid,
-                "type": ntype,
+                "type": ntype.lower() if ntype else "unknown",
                 "properties": nprops,
             }
+            rel_type = link["rel_type"]
+            source, target = (entity_id, nid) if link["outgoing"] else (nid, entity_id)
             edges.append({
-                "id": f"{nid}-{rel.type}-{entity_id}",
-                "source": nid,
-                "target": entity_id,
-                "type": rel.type,
-                "properties": dict(rel),
+                "id": f"{source}-{rel_type}-{target}",
+                "source": source,
+                "target": target,
+                "type": rel_type,
+                "properties": link["rel_props"],
             })
 
         return {
@@ -342,6 +487,17 @@ class Neo4jService:
             records = [r async for r in result]
             return [r["meeting_id"] for r in records]
 
+    async def find_meetings_for_entities(self, entity_ids: list[str]) -> dict[str, list[str]]:
+        """Meeting ids linked to each entity, for many entities in one round-trip."""
+        query = """
+        UNWIND $entity_ids AS eid
+        MATCH (e {id: eid})-[:ATTENDED|MENTIONED_IN|DISCUSSED]-(m:Meeting)
+        RETURN eid as entity_id, collect(DISTINCT m.id) as meeting_ids
+        """
+        async with self.driver.session() as session:
+            result = await session.run(query, entity_ids=entity_ids)
+            return {r["entity_id"]: r["meeting_ids"] async for r in result}
+
     async def search_entities_by_name(self, name: str, limit: int = 10) -> list[dict]:
         query = """
         MATCH (e)
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import time
 import uuid
 from datetime import datetime
@@ -35,6 +36,30 @@ logger = logging.getLogger(__name__)
 SYNC_LOCK_KEY = "meeting_assistant:sync_lock"
 BRIEFING_LOCK_KEY = "meeting_assistant:briefing_lock"
 DEFAULT_LOCK_TTL = 300
+SYNC_QUEUE_SIZE = 32
+
+# Manual triggers wait briefly for a running pipeline instead of skipping:
+# exponential backoff from 50ms up to 2s, giving up after 10s
+LOCK_WAIT_BUDGET_SECONDS = 10.0
+LOCK_POLL_INITIAL_SECONDS = 0.05
+LOCK_POLL_MAX_SECONDS = 2.0
+
+# Compare-and-delete: only the run holding the token may release the lock,
+# so a run that outlived its TTL can't delete a lock a newer run acquired
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Refresh the TTL only while the lock still holds this run's token
+EXTEND_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('expire', KEYS[1], ARGV[2])
+end
+return 0
+"""
 
 
 class SchedulerService:
@@ -48,6 +73,9 @@ class SchedulerService:
         self.agent_registry = agent_registry
         self.mcp_registry = mcp_registry
         self._scheduler: AsyncIOScheduler | None = None
+        # register_script sends EVALSHA and falls back to EVAL on a cache miss
+        self._release_lock = redis_client.register_script(RELEASE_LOCK_SCRIPT)
+        self._extend_lock_script = redis_client.register_script(EXTEND_LOCK_SCRIPT)
 
     async def start(self) -> None:
         self._scheduler = AsyncIOScheduler()
@@ -83,32 +111,75 @@ class SchedulerService:
             self._scheduler = None
             logger.info("Scheduler stopped")
 
-    async def acquire_sync_lock(self, lock_key: str = SYNC_LOCK_KEY, ttl_seconds: int = DEFAULT_LOCK_TTL) -> bool:
-        acquired = await self.redis_client.set(lock_key, "1", nx=True, ex=ttl_seconds)
+    async def acquire_sync_lock(
+        self, token: str, lock_key: str = SYNC_LOCK_KEY, ttl_seconds: int = DEFAULT_LOCK_TTL
+    ) -> bool:
+        acquired = await self.redis_client.set(lock_key, token, nx=True, ex=ttl_seconds)
         return bool(acquired)
 
-    async def release_sync_lock(self, lock_key: str = SYNC_LOCK_KEY) -> None:
-        await self.redis_client.delete(lock_key)
+    async def release_sync_lock(self, token: str, lock_key: str = SYNC_LOCK_KEY) -> None:
+        released = await self._release_lock(keys=[lock_key], args=[token])
+        if not released:
+            logger.warning("Lock %s expired or was taken over before release", lock_key)
+
+    async def _acquire_with_backoff(self, token: str, lock_key: str, ttl_seconds: int) -> bool:
+        delay = LOCK_POLL_INITIAL_SECONDS
+        deadline = time.monotonic() + LOCK_WAIT_BUDGET_SECONDS
+        while True:
+            if await self.acquire_sync_lock(token, lock_key, ttl_seconds=ttl_seconds):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            # Jitter keeps several backends from polling in lockstep
+            await asyncio.sleep(min(delay + random.uniform(0, delay * 0.1), remaining))
+            delay = min(delay * 2, LOCK_POLL_MAX_SECONDS)
+
+    async def _extend_lock(self, lock_key: str, token: str, ttl_seconds: int) -> None:
+        """Keep a held lock alive for as long as the pipeline runs."""
+        while True:
+            await asyncio.sleep(ttl_seconds / 3)
+            try:
+                extended = await self._extend_lock_script(
+                    keys=[lock_key], args=[token, ttl_seconds]
+                )
+            except Exception as e:
+                logger.warning("Failed to extend lock %s: %s", lock_key, e)
+                continue
+            if not extended:
+                logger.warning("Lock %s lost while pipeline still running", lock_key)
+                return
+
+    def _start_extender(
+        self, lock_key: str, token: str, ttl_seconds: int = DEFAULT_LOCK_TTL
+    ) -> asyncio.Task:
+        return asyncio.create_task(self._extend_lock(lock_key, token, ttl_seconds))
 
     async def _run_sync_pipeline(self) -> None:
-        if not await self.acquire_sync_lock(SYNC_LOCK_KEY):
+        token = uuid.uuid4().hex
+        if not await self.acquire_sync_lock(token, SYNC_LOCK_KEY):
             logger.info("Sync pipeline already running (lock held), skipping")
             return
 
+        extender = self._start_extender(SYNC_LOCK_KEY, token)
         try:
             await self._execute_pipeline("sync", "scheduled")
         finally:
-            await self.release_sync_lock(SYNC_LOCK_KEY)
+            extender.cancel()
+            await self.release_sync_lock(token, SYNC_LOCK_KEY)
 
     async def _run_briefing_pipeline(self) -> None:
-        if not await self.acquire_sync_lock(BRIEFING_LOCK_KEY):
+        token = uuid.uuid4().hex
+        if not await self.acquire_sync_lock(token, BRIEFING_LOCK_KEY):
             logger.info("Briefing pipeline already running (lock held), skipping")
             return
 
+        extender = self._start_extender(BRIEFING_LOCK_KEY, token)
         try:
             await self._execute_pipeline("briefing", "scheduled")
         finally:
-            await self.release_sync_lock(BRIEFING_LOCK_KEY)
+            extender.cancel()
+            await self.release_sync_lock(token, BRIEFING_LOCK_KEY)
 
     async def _execute_pipeline(self, pipeline: str, trigger: str) -> dict[str, Any]:
         """Run all agents in *pipeline* sequentially, creating per-agent run logs."""
@@ -128,49 +199,63 @@ class SchedulerService:
         from app.agents.meeting_sync import sync_all_meetings
         from app.agents.profile_builder import build_profiles_from_meetings
         from app.agents.relationship_builder import build_relationships_from_meetings
-        from app.agents.entity_extraction import extract_entities_for_meetings
+        from app.agents.entity_extraction import extract_entities_from_queue
         from app.agents.run_tracker import run_agent_with_logging
         from app.mcp.base import ProviderStatus
 
         errors: list[Any] = []
-        sync_result = None
 
-        try:
-            granola = self.mcp_registry.get("granola")
-            if (await granola.health_check()) == ProviderStatus.HEALTHY:
-                sync_result = await run_agent_with_logging(
-                    "meeting_sync", "sync", trigger, sync_all_meetings,
-                    fn_args=(granola,),
+        # Every agent runs on its own sessions, so they can overlap their
+        # I/O waits. Failures are caught per agent rather than left to the
+        # TaskGroup, which would cancel the sibling agents on the first error.
+        async def _step(agent_name: str, execute_fn, *fn_args, **fn_kwargs) -> dict[str, Any]:
+            try:
+                return await run_agent_with_logging(
+                    agent_name, "sync", trigger, execute_fn,
+                    fn_args=fn_args, fn_kwargs=fn_kwargs,
                 )
-                errors.extend(sync_result.get("errors", []))
-        except (KeyError, Exception) as e:
-            logger.warning("Sync step skipped: %s", e)
-
-        try:
-            profile_result = await run_agent_with_logging(
-                "profile_builder", "sync", trigger, build_profiles_from_meetings,
-            )
-            errors.extend(profile_result.get("errors", []))
-        except Exception as e:
-            logger.warning("Profile builder failed: %s", e)
-
-        try:
-            await run_agent_with_logging(
-                "relationship_builder", "sync", trigger, build_relationships_from_meetings,
-            )
-        except Exception as e:
-            logger.warning("Relationship builder failed: %s", e)
-
-        try:
-            await run_agent_with_logging(
-                "entity_extraction", "sync", trigger, extract_entities_for_meetings,
-                fn_kwargs={
-                    "meeting_ids": sync_result.get("new_meeting_ids", []) if sync_result else None,
-                    "limit": 20,
-                },
-            )
-        except Exception as e:
-            logger.warning("Entity extraction failed: %s", e)
+            except Exception as e:
+                logger.warning("%s failed: %s", agent_name, e)
+                errors.append({"agent": agent_name, "error": str(e)})
+                return {}
+
+        # Entity extraction consumes new meeting ids while meeting_sync is
+        # still fetching from Granola; the bounded queue applies backpressure
+        meeting_queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=SYNC_QUEUE_SIZE)
+        sentinel_sent = asyncio.Event()
+
+        async def _consume() -> None:
+            await _step("entity_extraction", extract_entities_from_queue, meeting_queue, limit=20)
+            # Extraction can stop before reading the sentinel (e.g. its run
+            # log failed to commit). Keep draining until it arrives, or
+            # meeting_sync would block forever on the full queue while the
+            # lock extender keeps the pipeline lock alive.
+            if not sentinel_sent.is_set() or not meeting_queue.empty():
+                while await meeting_queue.get() is not None:
+                    pass
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(_consume())
+
+            try:
+                granola = self.mcp_registry.get("granola")
+                if (await granola.health_check()) == ProviderStatus.HEALTHY:
+                    sync_result = await run_agent_with_logging(
+                        "meeting_sync", "sync", trigger, sync_all_meetings,
+                        fn_args=(granola, meeting_queue),
+                    )
+                    errors.extend(sync_result.get("errors", []))
+            except (KeyError, Exception) as e:
+                logger.warning("Sync step skipped: %s", e)
+            finally:
+                # Cannot block indefinitely: the consumer reads until None
+                await meeting_queue.put(None)
+                sentinel_sent.set()
+
+            profile_task = tg.create_task(_step("profile_builder", build_profiles_from_meetings))
+            tg.create_task(_step("relationship_builder", build_relationships_from_meetings))
+
+        errors.extend(profile_task.result().get("errors", []))
 
         return {"status": "completed", "errors": errors}
 
@@ -189,10 +274,13 @@ class SchedulerService:
 
     async def trigger_pipeline(self, pipeline: str, trigger: str = "manual") -> dict[str, Any]:
         lock_key = SYNC_LOCK_KEY if pipeline == "sync" else BRIEFING_LOCK_KEY
-        if not await self.acquire_sync_lock(lock_key, ttl_seconds=600):
+        token = uuid.uuid4().hex
+        if not await self._acquire_with_backoff(token, lock_key, ttl_seconds=600):
             return {"status": "skipped", "reason": "Pipeline already running"}
 
+        extender = self._start_extender(lock_key, token, ttl_seconds=600)
         try:
             return await self._execute_pipeline(pipeline, trigger)
         finally:
-            await self.release_sync_lock(lock_key)
+            extender.cancel()
+            await self.release_sync_lock(token, lock_key)
@@ -1,17 +1,35 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import hashlib
+import heapq
 import logging
+from operator import itemgetter
 from typing import Any
 
+import numpy as np
 from neo4j import AsyncDriver
+from pgvector import HalfVector
+from redis.asyncio import Redis
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.postgres import async_session_factory
 from app.services.embedding_service import EmbeddingService
 from app.services.neo4j_service import Neo4jService
 
 logger = logging.getLogger(__name__)
 
+# Below this many fused rows the plain dict loop beats NumPy's setup cost
+RRF_NUMPY_MIN_RESULTS = 500
+
+QUERY_EMBEDDING_TTL = 3600
+
+# Candidate queries stream through a server-side cursor in batches of this
+# size, so memory stays bounded if the per-source limits are raised
+STREAM_BATCH_SIZE = 50
+
 
 class SearchService:
     def __init__(
@@ -19,96 +37,115 @@ class SearchService:
         session: AsyncSession,
         neo4j_driver: AsyncDriver,
         embedding_service: EmbeddingService,
+        redis_client: Redis | None = None,
     ) -> None:
         self.session = session
         self.neo4j_driver = neo4j_driver
         self.embedding_service = embedding_service
+        self.redis_client = redis_client
 
     async def hybrid_search(
         self, query: str, page: int = 1, page_size: int = 20
     ) -> dict[str, Any]:
-        fts_results = await self.full_text_search(query, limit=50)
-        sem_results = await self.semantic_search(query, limit=50)
-        graph_results = await self.graph_search(query, limit=50)
-
-        merged = self.reciprocal_rank_fusion(fts_results, sem_results, graph_results)
+        # The three sources hit independent backends. AsyncSession can't be
+        # shared between concurrent tasks, so semantic search gets its own
+        # short-lived session alongside the request's FTS session.
+        async def _semantic() -> list[dict[str, Any]]:
+            async with async_session_factory() as session:
+                service = SearchService(
+                    session, self.neo4j_driver, self.embedding_service, self.redis_client
+                )
+                return await service.semantic_search(query, limit=50)
+
+        outcomes = await asyncio.gather(
+            self.full_text_search(query, limit=50),
+            _semantic(),
+            self.graph_search(query, limit=50),
+            return_exceptions=True,
+        )
+        fts_results, sem_results, graph_results = [
+            [] if isinstance(outcome, BaseException) else outcome
+            for outcome in outcomes
+        ]
+        for source, outcome in zip(("fulltext", "semantic", "graph"), outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning("%s search failed: %s", source, outcome)
 
         start = (page - 1) * page_size
-        paginated = merged[start : start + page_size]
+        merged = self.reciprocal_rank_fusion(
+            fts_results, sem_results, graph_results, limit=start + page_size
+        )
+        paginated = merged[start:]
+        await self._add_headlines(paginated, query)
 
         return {
             "results": paginated,
-            "total": len(merged),
+            "total": len({
+                r["meeting_id"] for results in (fts_results, sem_results, graph_results)
+                for r in results
+            }),
             "synthesis": None,
         }
 
     async def full_text_search(self, query: str, limit: int = 50) -> list[dict[str, Any]]:
-        words = [w for w in query.split() if w.strip()]
-        ts_query = " | ".join(words) if words else query
-
-        meeting_sql = text("""
-            SELECT
-                m.id::text as meeting_id,
-                m.title,
-                m.date::text as date,
-                ts_rank_cd(m.search_vector, to_tsquery('english', :q)) as rank,
-                ts_headline('english', m.raw_notes, to_tsquery('english', :q),
-                    'MaxWords=40, MinWords=20, StartSel=**, StopSel=**') as snippet
-            FROM meetings m
-            WHERE m.search_vector @@ to_tsquery('english', :q)
-            ORDER BY rank DESC
-            LIMIT :limit
-        """)
-
-        chunk_sql = text("""
-            SELECT
-                tc.meeting_id::text as meeting_id,
-                m.title,
-                m.date::text as date,
-                ts_rank_cd(tc.search_vector, to_tsquery('english', :q)) as rank,
-                ts_headline('english', tc.content, to_tsquery('english', :q),
-                    'MaxWords=40, MinWords=20, StartSel=**, StopSel=**') as snippet
-            FROM transcript_chunks tc
-            JOIN meetings m ON m.id = tc.meeting_id
-            WHERE tc.search_vector @@ to_tsquery('english', :q)
+        # Both sides are ranked and limited by Postgres, then merged keeping
+        # each meeting's best hit, so one round-trip returns the final list.
+        # Snippets are plain prefixes here; hybrid_search highlights only
+        # the page it returns (see _add_headlines).
+        fts_sql = text("""
+            SELECT meeting_id, title, date, rank, snippet FROM (
+                SELECT DISTINCT ON (meeting_id) * FROM (
+                    (
+                        SELECT
+                            m.id::text as meeting_id,
+                            m.title,
+                            m.date::text as date,
+                            ts_rank_cd(m.search_vector, websearch_to_tsquery('english', :q)) as rank,
+                            SUBSTRING(m.raw_notes, 1, 200) as snippet
+                        FROM meetings m
+                        WHERE m.search_vector @@ websearch_to_tsquery('english', :q)
+                        ORDER BY rank DESC
+                        LIMIT :limit
+                    )
+                    UNION ALL
+                    (
+                        SELECT
+                            tc.meeting_id::text as meeting_id,
+                            m.title,
+                            m.date::text as date,
+                            ts_rank_cd(tc.search_vector, websearch_to_tsquery('english', :q)) as rank,
+                            SUBSTRING(tc.content, 1, 200) as snippet
+                        FROM transcript_chunks tc
+                        JOIN meetings m ON m.id = tc.meeting_id
+                        WHERE tc.search_vector @@ websearch_to_tsquery('english', :q)
+                        ORDER BY rank DESC
+                        LIMIT :limit
+                    )
+                ) hits
+                ORDER BY meeting_id, rank DESC
+            ) best
             ORDER BY rank DESC
             LIMIT :limit
         """)
 
         results: list[dict[str, Any]] = []
-        seen: set[str] = set()
-
-        try:
-            meeting_result = await self.session.execute(meeting_sql, {"q": ts_query, "limit": limit})
-            for row in meeting_result:
-                if row.meeting_id not in seen:
-                    seen.add(row.meeting_id)
-                    results.append({
-                        "meeting_id": row.meeting_id,
-                        "title": row.title,
-                        "date": row.date,
-                        "snippet": row.snippet or "",
-                        "score": float(row.rank),
-                        "source": "fulltext",
-                    })
-        except Exception:
-            logger.debug("Full-text search on meetings failed (search_vector may not be populated)")
 
         try:
-            chunk_result = await self.session.execute(chunk_sql, {"q": ts_query, "limit": limit})
-            for row in chunk_result:
-                if row.meeting_id not in seen:
-                    seen.add(row.meeting_id)
-                    results.append({
-                        "meeting_id": row.meeting_id,
-                        "title": row.title,
-                        "date": row.date,
-                        "snippet": row.snippet or "",
-                        "score": float(row.rank),
-                        "source": "fulltext",
-                    })
+            fts_result = await self.session.stream(
+                fts_sql.execution_options(yield_per=STREAM_BATCH_SIZE),
+                {"q": query, "limit": limit},
+            )
+            async for row in fts_result:
+                results.append({
+                    "meeting_id": row.meeting_id,
+                    "title": row.title,
+                    "date": row.date,
+                    "snippet": row.snippet or "",
+                    "score": float(row.rank),
+                    "source": "fulltext",
+                })
         except Exception:
-            logger.debug("Full-text search on transcript_chunks failed (search_vector may not be populated)")
+            logger.debug("Full-text search failed (search_vector may not be populated)")
 
         if not results:
             fallback_sql = text("""
@@ -143,79 +180,148 @@ class SearchService:
 
         return results
 
-    async def semantic_search(self, query: str, limit: int = 50) -> list[dict[str, Any]]:
-        try:
-            query_embedding = await self.embedding_service.embed_text(query)
-        except Exception:
-            logger.warning("Failed to generate query embedding, skipping semantic search")
-            return []
+    async def _add_headlines(self, results: list[dict[str, Any]], query: str) -> None:
+        """Replace full-text snippets on one page of results with ts_headline output.
+
+        ts_headline re-parses the whole document, so it runs once per shown
+        result instead of once per candidate row.
+        """
+        ids = [r["meeting_id"] for r in results if r.get("source") == "fulltext"]
+        if not ids:
+            return
 
-        meeting_sql = text("""
+        headline_sql = text("""
             SELECT
                 m.id::text as meeting_id,
-                m.title,
-                m.date::text as date,
-                SUBSTRING(m.raw_notes, 1, 200) as snippet,
-                1 - (m.embedding <=> :embedding::vector) as similarity
+                ts_headline('english', COALESCE(
+                    CASE WHEN m.search_vector @@ websearch_to_tsquery('english', :q) THEN m.raw_notes END,
+                    (
+                        SELECT tc.content
+                        FROM transcript_chunks tc
+                        WHERE tc.meeting_id = m.id
+                          AND tc.search_vector @@ websearch_to_tsquery('english', :q)
+                        ORDER BY ts_rank_cd(tc.search_vector, websearch_to_tsquery('english', :q)) DESC
+                        LIMIT 1
+                    )
+                ), websearch_to_tsquery('english', :q),
+                    'MaxWords=40, MinWords=20, StartSel=**, StopSel=**') as snippet
             FROM meetings m
-            WHERE m.embedding IS NOT NULL
-            ORDER BY m.embedding <=> :embedding::vector
-            LIMIT :limit
+            WHERE m.id = ANY(CAST(:ids AS uuid[]))
         """)
 
-        chunk_sql = text("""
-            SELECT
-                tc.meeting_id::text as meeting_id,
-                m.title,
-                m.date::text as date,
-                SUBSTRING(tc.content, 1, 200) as snippet,
-                1 - (tc.embedding <=> :embedding::vector) as similarity
-            FROM transcript_chunks tc
-            JOIN meetings m ON m.id = tc.meeting_id
-            WHERE tc.embedding IS NOT NULL
-            ORDER BY tc.embedding <=> :embedding::vector
-            LIMIT :limit
-        """)
+        try:
+            rows = await self.session.execute(
+                headline_sql, {"q": query, "ids": ids}
+            )
+            headlines = {row.meeting_id: row.snippet for row in rows if row.snippet}
+        except Exception:
+            logger.debug("ts_headline snippet generation failed, keeping plain snippets")
+            return
 
-        results: list[dict[str, Any]] = []
-        seen: set[str] = set()
-        emb_str = str(query_embedding)
+        for r in results:
+            if r.get("source") == "fulltext" and r["meeting_id"] in headlines:
+                r["snippet"] = headlines[r["meeting_id"]]
+
+    async def _embed_query(self, query: str) -> list[float]:
+        """Embed a search query, reusing a Redis-cached vector for repeat queries."""
+        if self.redis_client is None:
+            return await self.embedding_service.embed_text(query)
 
+        digest = hashlib.blake2b(query.strip().encode(), digest_size=16).hexdigest()
+        key = f"emb:{self.embedding_service.model}:{digest}"
         try:
-            meeting_result = await self.session.execute(
-                meeting_sql, {"embedding": emb_str, "limit": limit}
-            )
-            for row in meeting_result:
-                if row.meeting_id not in seen and row.similarity > 0.3:
-                    seen.add(row.meeting_id)
-                    results.append({
-                        "meeting_id": row.meeting_id,
-                        "title": row.title,
-                        "date": row.date,
-                        "snippet": row.snippet or "",
-                        "score": float(row.similarity),
-                        "source": "semantic",
-                    })
+            cached = await self.redis_client.get(key)
+        except Exception:
+            logger.debug("Query embedding cache read failed")
+            cached = None
+        if cached:
+            # Stored as base64 float32 since the shared client decodes responses
+            return np.frombuffer(base64.b64decode(cached), dtype=np.float32).tolist()
+
+        embedding = await self.embedding_service.embed_text(query)
+        packed = base64.b64encode(np.asarray(embedding, dtype=np.float32).tobytes()).decode()
+        try:
+            await self.redis_client.set(key, packed, ex=QUERY_EMBEDDING_TTL)
         except Exception:
-            logger.debug("Semantic search on meetings failed (no embeddings populated yet)")
+            logger.debug("Query embedding cache write failed")
+        return embedding
+
+    async def semantic_search(self, query: str, limit: int = 50) -> list[dict[str, Any]]:
+        # A blank query would embed to the zero vector, whose cosine distance
+        # is undefined, so don't build one at all
+        if not query.strip():
+            return []
 
         try:
-            chunk_result = await self.session.execute(
-                chunk_sql, {"embedding": emb_str, "limit": limit}
-            )
-            for row in chunk_result:
-                if row.meeting_id not in seen and row.similarity > 0.3:
-                    seen.add(row.meeting_id)
-                    results.append({
-                        "meeting_id": row.meeting_id,
-                        "title": row.title,
-                        "date": row.date,
-                        "snippet": row.snippet or "",
-                        "score": float(row.similarity),
-                        "source": "semantic",
-                    })
+            query_embedding = await self._embed_query(query)
         except Exception:
-            logger.debug("Semantic search on transcript_chunks failed (no embeddings populated yet)")
+            logger.warning("Failed to generate query embedding, skipping semantic search")
+            return []
+
+        # Each side keeps its own ORDER BY ... LIMIT so the HNSW indexes still
+        # drive the scans; the chunk side takes its nearest neighbours from
+        # the embeddings table alone before joining, so the planner can't
+        # trade the index scan for a join-then-sort. The outer query merges
+        # both sides per meeting.
+        semantic_sql = text("""
+            SELECT meeting_id, title, date, snippet, similarity FROM (
+                SELECT DISTINCT ON (meeting_id) * FROM (
+                    (
+                        SELECT
+                            m.id::text as meeting_id,
+                            m.title,
+                            m.date::text as date,
+                            SUBSTRING(m.raw_notes, 1, 200) as snippet,
+                            1 - (m.embedding <=> CAST(:embedding AS halfvec)) as similarity
+                        FROM meetings m
+                        WHERE m.embedding IS NOT NULL
+                        ORDER BY m.embedding <=> CAST(:embedding AS halfvec)
+                        LIMIT :limit
+                    )
+                    UNION ALL
+                    (
+                        SELECT
+                            tc.meeting_id::text as meeting_id,
+                            m.title,
+                            m.date::text as date,
+                            SUBSTRING(tc.content, 1, 200) as snippet,
+                            1 - nn.distance as similarity
+                        FROM (
+                            SELECT chunk_id, embedding <=> CAST(:embedding AS halfvec) as distance
+                            FROM transcript_chunk_embeddings
+                            ORDER BY embedding <=> CAST(:embedding AS halfvec)
+                            LIMIT :limit
+                        ) nn
+                        JOIN transcript_chunks tc ON tc.id = nn.chunk_id
+                        JOIN meetings m ON m.id = tc.meeting_id
+                    )
+                ) hits
+                WHERE similarity > 0.3
+                ORDER BY meeting_id, similarity DESC
+            ) best
+            ORDER BY similarity DESC
+            LIMIT :limit
+        """)
+
+        results: list[dict[str, Any]] = []
+        query_vector = HalfVector(query_embedding)
+
+        try:
+            semantic_result = await self.session.stream(
+                semantic_sql.execution_options(yield_per=STREAM_BATCH_SIZE),
+                {"embedding": query_vector, "limit": limit},
+            )
+            async for row in semantic_result:
+                results.append({
+                    "meeting_id": row.meeting_id,
+                    "title": row.title,
+                    "date": row.date,
+                    "snippet": row.snippet or "",
+                    "score": float(row.similarity),
+                    "source": "semantic",
+                })
+        except Exception as e:
+            logger.warning("Semantic search failed: %s", e)
 
         return results
 
@@ -231,46 +337,88 @@ class SearchService:
         results: list[dict[str, Any]] = []
         seen: set[str] = set()
 
+        try:
+            meetings_by_entity = await neo4j_service.find_meetings_for_entities(
+                [entity["id"] for entity in entities]
+            )
+        except Exception:
+            logger.debug("Neo4j meeting lookup failed")
+            return []
+
         for entity in entities:
-            try:
-                meeting_ids = await neo4j_service.find_meetings_for_entity(entity["id"])
-                for mid in meeting_ids:
-                    if mid not in seen:
-                        seen.add(mid)
-                        results.append({
-                            "meeting_id": mid,
-                            "title": f"Related to {entity['name']}",
-                            "date": "",
-                            "snippet": f"Connected via {entity['type']}: {entity['name']}",
-                            "score": 0.8,
-                            "source": "graph",
-                        })
-            except Exception:
-                continue
+            for mid in meetings_by_entity.get(entity["id"], []):
+                if mid not in seen:
+                    seen.add(mid)
+                    results.append({
+                        "meeting_id": mid,
+                        "title": f"Related to {entity['name']}",
+                        "date": "",
+                        "snippet": f"Connected via {entity['type']}: {entity['name']}",
+                        "score": 0.8,
+                        "source": "graph",
+                    })
 
         return results[:limit]
 
     def reciprocal_rank_fusion(
-        self, *result_lists: list[dict[str, Any]], k: int = 60
+        self,
+        *result_lists: list[dict[str, Any]],
+        k: int = 60,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
-        scores: dict[str, float] = {}
-        best_result: dict[str, dict] = {}
+        """Fuse ranked lists into one, returning the top *limit* (all if None).
+
+        The winning result dict of each meeting is reused with its score
+        replaced by the fused RRF score.
+        """
+        if sum(len(results) for results in result_lists) >= RRF_NUMPY_MIN_RESULTS:
+            return self._rrf_numpy(result_lists, k, limit)
 
+        # One pass: meeting_id -> [fused score, best-scoring result]
+        accum: dict[str, list] = {}
         for results in result_lists:
             for rank, result in enumerate(results):
-                mid = result["meeting_id"]
                 rrf_score = 1.0 / (k + rank + 1)
-                scores[mid] = scores.get(mid, 0) + rrf_score
+                entry = accum.get(result["meeting_id"])
+                if entry is None:
+                    accum[result["meeting_id"]] = [rrf_score, result]
+                    continue
+                entry[0] += rrf_score
+                if result.get("score", 0) > entry[1].get("score", 0):
+                    entry[1] = result
+
+        if limit is None:
+            ranked = sorted(accum.values(), key=itemgetter(0), reverse=True)
+        else:
+            ranked = heapq.nlargest(limit, accum.values(), key=itemgetter(0))
 
+        output: list[dict[str, Any]] = []
+        for rrf_score, best in ranked:
+            best["score"] = round(rrf_score, 6)
+            output.append(best)
+        return output
+
+    @staticmethod
+    def _rrf_numpy(
+        result_lists: tuple[list[dict[str, Any]], ...], k: int, limit: int | None
+    ) -> list[dict[str, Any]]:
+        best_result: dict[str, dict] = {}
+        for results in result_lists:
+            for result in results:
+                mid = result["meeting_id"]
                 if mid not in best_result or result.get("score", 0) > best_result[mid].get("score", 0):
                     best_result[mid] = result
 
-        ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        mids = [r["meeting_id"] for results in result_lists for r in results]
+        ranks = np.concatenate([np.arange(len(results)) for results in result_lists])
+        ids, first_seen, inverse = np.unique(mids, return_index=True, return_inverse=True)
+        totals = np.bincount(inverse, weights=1.0 / (k + ranks + 1))
+        # Highest score first; ties keep first-appearance order like the dict path
+        order = np.lexsort((first_seen, -totals))[:limit]
 
         output: list[dict[str, Any]] = []
-        for mid, rrf_score in ranked:
-            entry = dict(best_result[mid])
-            entry["score"] = round(rrf_score, 6)
-            output.append(entry)
-
+        for i in order:
+            best = best_result[str(ids[i])]
+            best["score"] = round(float(totals[i]), 6)
+            output.append(best)
         return output
@@ -0,0 +1,133 @@
+import re
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from rapidfuzz import fuzz
+
+from app.services.entity_resolution_service import (
+    FUZZY_THRESHOLD,
+    TRGM_PREFILTER_THRESHOLD,
+    EntityResolutionService,
+    forget_resolutions,
+)
+
+SHORT_NAME_PAIRS = [
+    ("jon", "john"),
+    ("ann", "anne"),
+    ("sara", "sarah"),
+    ("jon smith", "john smith"),
+    ("alex", "alexx"),
+]
+
+
+@pytest.fixture(autouse=True)
+def _empty_resolve_cache():
+    forget_resolutions()
+    yield
+    forget_resolutions()
+
+
+def _trigrams(value: str) -> set[str]:
+    # Same padding and word splitting as pg_trgm's show_trgm()
+    grams: set[str] = set()
+    for word in re.findall(r"[a-z0-9]+", value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _trgm_similarity(a: str, b: str) -> float:
+    left, right = _trigrams(a), _trigrams(b)
+    return len(left & right) / len(left | right)
+
+
+@pytest.mark.parametrize("mention,existing", SHORT_NAME_PAIRS)
+def test_trigram_prefilter_admits_short_ratio_matches(mention: str, existing: str) -> None:
+    assert fuzz.ratio(mention, existing) >= FUZZY_THRESHOLD
+    assert _trgm_similarity(mention, existing) >= TRGM_PREFILTER_THRESHOLD
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mention,existing", SHORT_NAME_PAIRS)
+async def test_fuzzy_match_short_names(mention: str, existing: str) -> None:
+    profile_id = uuid.uuid4()
+    candidates = MagicMock()
+    candidates.all.return_value = [
+        SimpleNamespace(id=profile_id, name=existing.title(), type="contact"),
+    ]
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=[MagicMock(), candidates])
+
+    service = EntityResolutionService(session, embedding_service=MagicMock())
+    match = await service.fuzzy_match(mention.title())
+
+    assert match == {"entity_id": str(profile_id), "name": existing.title(), "type": "contact"}
+    threshold_params = session.execute.await_args_list[0].args[1]
+    assert threshold_params == {"limit": str(TRGM_PREFILTER_THRESHOLD)}
+
+
+@pytest.mark.asyncio
+async def test_resolve_many_exact_hits_skip_embedding() -> None:
+    profile_id = uuid.uuid4()
+    rows = MagicMock()
+    rows.all.return_value = [
+        SimpleNamespace(id=profile_id, name="Sarah Chen", type="contact", email="sarah@example.com"),
+    ]
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=rows)
+    embedding_service = MagicMock()
+    embedding_service.embed_batch = AsyncMock()
+
+    service = EntityResolutionService(session, embedding_service)
+    resolved = await service.resolve_many(
+        [
+            {"name": "Sarah Chen", "email": "Sarah@Example.com"},
+            {"name": "Sarah", "email": "sarah@example.com"},
+        ],
+        meeting_id="m1",
+    )
+
+    assert [r["entity_id"] for r in resolved] == [str(profile_id)] * 2
+    assert not any(r["is_new"] for r in resolved)
+    session.execute.assert_awaited_once()
+    embedding_service.embed_batch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_match_many_scores_pooled_candidates() -> None:
+    john, anne = uuid.uuid4(), uuid.uuid4()
+    candidates = MagicMock()
+    candidates.all.return_value = [
+        SimpleNamespace(id=john, name="John", type="contact"),
+        SimpleNamespace(id=anne, name="Anne", type="contact"),
+    ]
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=[MagicMock(), candidates])
+
+    service = EntityResolutionService(session, embedding_service=MagicMock())
+    hits = await service._fuzzy_match_many(["Jon", "Ann", "Priya"])
+
+    assert [h and h["entity_id"] for h in hits] == [str(john), str(anne), None]
+
+
+@pytest.mark.asyncio
+async def test_resolve_many_reuses_cached_match_until_forgotten() -> None:
+    profile_id = uuid.uuid4()
+    rows = MagicMock()
+    rows.all.return_value = [
+        SimpleNamespace(id=profile_id, name="Acme", type="org", email=None),
+    ]
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=rows)
+    mention = {"name": "Acme", "entity_type": "org"}
+
+    first = await EntityResolutionService(session, MagicMock()).resolve_many([mention], "m1")
+    second = await EntityResolutionService(session, MagicMock()).resolve_many([mention], "m2")
+    assert first == second == [{"entity_id": str(profile_id), "name": "Acme", "type": "org", "is_new": False}]
+    session.execute.assert_awaited_once()
+
+    forget_resolutions(str(profile_id))
+    await EntityResolutionService(session, MagicMock()).resolve_many([mention], "m3")
+    assert session.execute.await_count == 2
@@ -125,12 +125,11 @@ function PastMeetings() {
     isFetchingNextPage,
   } = useInfiniteQuery({
     queryKey: ["meetings-infinite"],
-    queryFn: ({ pageParam = 1 }) => api.meetings.list(pageParam, PAGE_SIZE),
-    getNextPageParam: (lastPage, allPages) => {
-      const loaded = allPages.reduce((n, p) => n + p.items.length, 0);
-      return loaded < lastPage.total ? allPages.length + 1 : undefined;
-    },
-    initialPageParam: 1,
+    // Keyset paging: only the first page asks for an exact total
+    queryFn: ({ pageParam }) =>
+      api.meetings.list(1, PAGE_SIZE, pageParam ? { cursor: pageParam } : { count: true }),
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
+    initialPageParam: undefined as string | undefined,
   });
 
   const sentinelRef = useRef<HTMLDivElement>(null);
@@ -17,7 +17,7 @@ import { DashboardHero } from "@/components/dashboard/DashboardHero";
 export default function DashboardPage() {
   const { data: meetings } = useQuery({
     queryKey: ["meetings", "dashboard"],
-    queryFn: () => api.meetings.list(1, 5),
+    queryFn: () => api.meetings.list(1, 5, { count: true }),
   });
 
   const { data: actionItems } = useQuery({
@@ -65,10 +65,12 @@ export const api = {
     ),
 
   meetings: {
-    list: (page = 1, pageSize = 20) =>
-      fetchAPI<PaginatedResponse<Meeting>>(
-        `/api/meetings/?page=${page}&page_size=${pageSize}`,
-      ),
+    list: (page = 1, pageSize = 20, opts: { cursor?: string; count?: boolean } = {}) => {
+      const params = new URLSearchParams({ page: String(page), page_size: String(pageSize) });
+      if (opts.cursor) params.set("cursor", opts.cursor);
+      if (opts.count) params.set("count", "true");
+      return fetchAPI<PaginatedResponse<Meeting>>(`/api/meetings/?${params}`);
+    },
     get: (id: string) => fetchAPI<MeetingDetail>(`/api/meetings/${id}`),
     resync: (id: string) =>
       fetchAPI<{ status: string; has_notes?: boolean; has_summary?: boolean; transcript_chunks?: number }>(
@@ -99,27 +99,28 @@ Quarterly review meeting with your manager, David Park. This is a good opportuni
 
 
 async def main():
-    async with async_session_factory() as session:
-        stmt = select(Meeting).order_by(Meeting.date.desc()).limit(2)
-        result = await session.execute(stmt)
-        meetings = result.scalars().all()
-
-        for i, sample in enumerate(SAMPLE_BRIEFINGS):
-            meeting_id = meetings[i].id if i < len(meetings) else None
-            briefing = Briefing(
-                id=uuid.uuid4(),
-                meeting_id=meeting_id,
-                calendar_event_id=f"gcal-event-{i + 1}",
-                title=sample["title"],
-                content=sample["content"],
-                topics=sample["topics"],
-                attendee_context=sample["attendee_context"],
-                action_items_context=sample["action_items_context"],
-            )
-            session.add(briefing)
-            print(f"Created briefing: {briefing.title} (id={briefing.id})")
-
-        await session.commit()
+    async with async_session_factory() as session, session.begin():
+        stmt = select(Meeting.id).order_by(Meeting.date.desc()).limit(2)
+        meeting_ids = (await session.execute(stmt)).scalars().all()
+
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "meeting_id": meeting_ids[i] if i < len(meeting_ids) else None,
+                "calendar_event_id": f"gcal-event-{i + 1}",
+                "title": sample["title"],
+                "content": sample["content"],
+                "topics": sample["topics"],
+                "attendee_context": sample["attendee_context"],
+                "action_items_context": sample["action_items_context"],
+            }
+            for i, sample in enumerate(SAMPLE_BRIEFINGS)
+        ]
+        # One executemany INSERT instead of a flush per briefing
+        await session.execute(Briefing.__table__.insert(), rows)
+        for row in rows:
+            print(f"Created briefing: {row['title']} (id={row['id']})")
+
         print(f"\nSeeded {len(SAMPLE_BRIEFINGS)} briefings.")
 
 
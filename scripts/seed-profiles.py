@@ -1,46 +1,115 @@
 """Create profiles from existing meeting attendees."""
 
-import asyncio
 import uuid
 
-from sqlalchemy import func, select
+import orjson
+import uvloop
+from sqlalchemy import Text, cast, func, literal, select, text
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 
 from app.db.postgres import async_session_factory
 from app.models.meeting import Attendee
 from app.models.profile import Profile
 
+# Past this many new profiles, COPY through a staging table beats VALUES
+COPY_THRESHOLD = 100
+PROFILE_COPY_COLUMNS = ("id", "type", "name", "email", "bio", "traits", "learning_log")
+
+
+async def _insert_profiles(session, rows: list[dict]) -> int:
+    """Insert new profiles, skipping any whose email already exists.
+
+    Returns the number of profiles actually created.
+    """
+    if len(rows) < COPY_THRESHOLD:
+        # The JSON columns are bound as text and cast on the server
+        stmt = (
+            pg_insert(Profile)
+            .values([
+                {
+                    **row,
+                    "traits": cast(literal(row["traits"], Text), JSONB),
+                    "learning_log": cast(literal(row["learning_log"], Text), JSONB),
+                }
+                for row in rows
+            ])
+            .on_conflict_do_nothing()
+            .returning(Profile.id)
+        )
+        return len((await session.execute(stmt)).all())
+
+    # COPY can't resolve conflicts, so it fills a staging table that the
+    # INSERT ... ON CONFLICT then drains. The dialect's jsonb codec takes
+    # serialized text, so the pre-built JSON goes through COPY as-is.
+    columns = ", ".join(PROFILE_COPY_COLUMNS)
+    await session.execute(text(
+        f"CREATE TEMP TABLE profile_seed ON COMMIT DROP AS "
+        f"SELECT {columns} FROM profiles WITH NO DATA"
+    ))
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        "profile_seed",
+        records=[tuple(row[col] for col in PROFILE_COPY_COLUMNS) for row in rows],
+        columns=list(PROFILE_COPY_COLUMNS),
+    )
+    result = await session.execute(text(
+        f"INSERT INTO profiles ({columns}) SELECT {columns} FROM profile_seed "
+        f"ON CONFLICT DO NOTHING RETURNING id"
+    ))
+    return len(result.all())
+
 
 async def seed():
-    async with async_session_factory() as session:
+    async with async_session_factory() as session, session.begin():
+        # Profiles can be re-seeded at will: skip the commit's WAL fsync and
+        # give the attendee DISTINCT ON room to sort in memory
+        await session.execute(text("SET LOCAL synchronous_commit = OFF"))
+        await session.execute(text("SET LOCAL work_mem = '64MB'"))
+        # One real attendee row per case-insensitive name, matching the dedup
+        # below; rows with an email win so the profile gets one
         result = await session.execute(
             select(Attendee.name, Attendee.email, Attendee.role)
-            .distinct(Attendee.name)
+            .distinct(func.lower(Attendee.name))
+            .order_by(func.lower(Attendee.name), Attendee.email.asc().nulls_last())
         )
         attendees = result.all()
 
-        created = 0
+        # One query for every existing name instead of a SELECT per attendee
+        existing_names = set(
+            (await session.execute(select(func.lower(Profile.name)))).scalars().all()
+        )
+
+        # Many attendees share a role: serialize each distinct traits
+        # document once and reuse the JSON text for every such row; both
+        # JSON columns carry serialized text from here on
+        traits_by_role: dict[str, str] = {}
+        rows = []
         for name, email, role in attendees:
-            existing = await session.execute(
-                select(Profile).where(func.lower(Profile.name) == name.lower())
-            )
-            if existing.scalar_one_or_none():
+            if name.lower() in existing_names:
                 continue
+            traits_json = traits_by_role.get(role or "")
+            if traits_json is None:
+                traits_json = traits_by_role[role or ""] = orjson.dumps(
+                    {"observed_roles": [role] if role else [], "meeting_count": 1}
+                ).decode()
+            rows.append({
+                "id": uuid.uuid4(),
+                "type": "contact",
+                "name": name,
+                # Core inserts skip Profile's @validates, so normalize here
+                "email": email.lower() if email else None,
+                "bio": f"{role}" if role else None,
+                "traits": traits_json,
+                "learning_log": "[]",
+            })
+
+        # Rows whose email collides with an existing profile are skipped,
+        # including one inserted concurrently since the preload
+        created = await _insert_profiles(session, rows) if rows else 0
 
-            profile = Profile(
-                id=uuid.uuid4(),
-                type="contact",
-                name=name,
-                email=email,
-                bio=f"{role}" if role else None,
-                traits={"observed_roles": [role] if role else [], "meeting_count": 1},
-                learning_log=[],
-            )
-            session.add(profile)
-            created += 1
-
-        await session.commit()
         print(f"Created {created} profiles from attendees ({len(attendees)} unique attendees found)")
 
 
 if __name__ == "__main__":
-    asyncio.run(seed())
+    uvloop.run(seed())